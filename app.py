@@ -1,22 +1,39 @@
+import os
+
 import streamlit as st
 
-from src.page import dtvp, mabc, spm
+from src import startup, trace
+from src.page import pages
 
 st.set_page_config(
     layout="wide",
     page_title="Reportus",
 )
 
+profile = startup.requested(st.query_params)
 
-def tabs():
-    return [
-        ("DTVP-3", lambda: dtvp.page("dtvp3")),
-        ("DTVP-A", lambda: dtvp.page("dtvpa")),
-        ("MABC", mabc.page),
-        ("SPM", spm.page),
-    ]
+page = st.navigation(
+    [
+        st.Page(
+            startup.wrap(path, page) if profile else page,
+            title=title,
+            url_path=path,
+            default=path == profile if profile in startup.PAGES else i == 0,
+        )
+        for i, (title, path, page) in enumerate(pages())
+    ],
+    position="top",
+)
 
+if os.environ.get("REPORTUS_TRACE"):
+    trace.enable()
+    with trace.session() as t:
+        page.run()
+    with st.expander("Trace"):
+        st.json(t.to_dict(), expanded=False)
+else:
+    page.run()
 
-for t_def, t in zip(tabs(), st.tabs([t[0] for t in tabs()])):
-    with t:
-        t_def[1]()
+if profile:
+    with st.expander("Startup"):
+        st.dataframe(startup.rows(), hide_index=True)
@@ -0,0 +1,174 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import timeit
+from typing import Any, Callable
+
+from src import pack, registry, table, time
+from src.report import dtvp, dtvpa, mabc, spm
+
+BASELINE = "bench/baseline.json"
+THRESHOLD = 0.25
+
+Case = tuple[str, Callable[[], object], Callable[[], None] | None]
+
+DATE = datetime.date(2026, 3, 3)
+
+
+def _mabc() -> tuple[time.Delta, dict[str, int | None]]:
+    age = time.Delta(years=8)
+    return age, {k: 5 for exes in mabc.get_comps(age).values() for k in exes}
+
+
+def _dtvp() -> tuple[time.Delta, dict[str, int]]:
+    return time.Delta(years=6, months=11), {k: 20 for k in dtvp.get_tests()}
+
+
+def _dtvpa() -> tuple[time.Delta, dict[str, int]]:
+    return time.Delta(years=13), {k: 20 for k in dtvpa.get_tests()}
+
+
+def _spm() -> dict[str, int]:
+    return {k: 20 for k in spm.get_scores()}
+
+
+def _process() -> list[tuple[str, Callable[[], object]]]:
+    m_age, m_raw = _mabc()
+    d_age, d_raw = _dtvp()
+    a_age, a_raw = _dtvpa()
+    filer = spm.filers("Home")[0]
+    return [
+        ("mabc", lambda: mabc.process.fn(m_age, m_raw, DATE)),
+        ("dtvp", lambda: dtvp.process.fn(d_age, d_raw, DATE)),
+        ("dtvpa", lambda: dtvpa.process.fn(a_age, a_raw, DATE)),
+        ("spm", lambda: spm.process.fn(DATE, "Home", 2, filer, "X", _spm())),
+    ]
+
+
+def _lookups() -> list[tuple[str, Callable[[], object]]]:
+    mi, mt = mabc._load()
+    ra, rs, sp = dtvp._load()
+    std, sums = dtvpa._load()
+    s = spm._load()
+    return [
+        ("mabc._get_i_row", lambda: mabc._get_i_row(mi, "hg2", 8, 30)),
+        ("mabc._get_t_row", lambda: mabc._get_t_row(mt, "bl", 20)),
+        ("dtvp._get_ra", lambda: dtvp._get_ra(ra, "fg", 40)),
+        ("dtvp._get_rs", lambda: dtvp._get_rs(rs, "fg", time.Delta(8, 3), 40)),
+        ("dtvp._get_sp", lambda: dtvp._get_sp(sp, "gvp", 50)),
+        ("dtvpa._get_std", lambda: dtvpa._get_std(std, "fg", time.Delta(13), 40)),
+        ("dtvpa._get_sum", lambda: dtvpa._get_sum(sums, "sum6", 60)),
+        ("spm._get_row", lambda: spm._get_row(s, "home2", "vis", 20)),
+    ]
+
+
+CSVS: list[tuple[str, type[Any]]] = [
+    ("public/dtvp-raw-ageeq.csv", dtvp.RawAge),
+    ("public/dtvp-raw-sca.csv", dtvp.RawSca),
+    ("public/dtvp-sca-per.csv", dtvp.ScaPer),
+    ("public/dtvpa-std.csv", dtvpa.Std),
+    ("public/dtvpa-sum.csv", dtvpa.Sum),
+    ("public/mabc-i.csv", mabc.IRow),
+    ("public/mabc-t.csv", mabc.TRow),
+    ("public/spm-classroom.csv", spm.Spm),
+    ("public/spm-home.csv", spm.Spm),
+    ("public/spm2-home.csv", spm.Spm),
+]
+
+
+def _read(path: str, cls: type[Any]) -> Callable[[], object]:
+    return lambda: table.read_csv(path, cls)
+
+
+def _cold() -> None:
+    registry.invalidate()
+    pack.open_pack.cache_clear()
+    table.compile_schema.cache_clear()
+
+
+def cases() -> list[Case]:
+    out: list[Case] = []
+    for name, fn in _process():
+        out.append((f"process.cold:{name}", fn, _cold))
+        out.append((f"process.warm:{name}", fn, None))
+    out += [(f"lookup:{name}", fn, None) for name, fn in _lookups()]
+    out += [(f"read_csv:{os.path.basename(p)}", _read(p, c), None) for p, c in CSVS]
+    for mod in [dtvp, dtvpa, mabc, spm]:
+        out.append((f"validate:{mod.__name__.rsplit('.', 1)[-1]}", mod.validate, None))
+    return out
+
+
+def measure(
+    fn: Callable[[], object], setup: Callable[[], None] | None, repeat: int = 3
+) -> float:
+    if setup is not None:
+        best = float("inf")
+        for _ in range(repeat * 2):
+            setup()
+            t = timeit.default_timer()
+            fn()
+            best = min(best, timeit.default_timer() - t)
+        return best
+
+    fn()
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(only: str | None = None, repeat: int = 3) -> dict[str, float]:
+    return {
+        name: measure(fn, setup, repeat)
+        for name, fn, setup in cases()
+        if only is None or only in name
+    }
+
+
+def compare(
+    current: dict[str, float], baseline: dict[str, float], threshold: float
+) -> list[str]:
+    return [
+        f"{name}: {baseline[name] * 1e6:.1f}us -> {t * 1e6:.1f}us"
+        for name, t in current.items()
+        if name in baseline and t > baseline[name] * (1 + threshold)
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="bench")
+    parser.add_argument("-k", "--only", help="run cases whose name contains this")
+    parser.add_argument("-b", "--baseline", default=BASELINE)
+    parser.add_argument("-t", "--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("-r", "--repeat", type=int, default=3)
+    parser.add_argument("--save", action="store_true", help="write a new baseline")
+    args = parser.parse_args(argv)
+
+    current = run(args.only, args.repeat)
+    for name, t in current.items():
+        print(f"{name:40} {t * 1e6:12.1f} us")
+
+    if args.save:
+        with open(args.baseline, "w") as f:
+            json.dump(
+                {"python": platform.python_version(), "results": current}, f, indent=2
+            )
+            f.write("\n")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}, run with --save", file=sys.stderr)
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+    regressions = compare(current, baseline, args.threshold)
+    for r in regressions:
+        print(f"regression {r}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,97 @@
+import datetime
+import json
+
 import pytest
 from streamlit.testing.v1 import AppTest
 
-from app import tabs
+from src import startup, trace
+from src.page import pages
 
 
-@pytest.mark.parametrize("rep", [t[0] for t in tabs()])
+@pytest.mark.parametrize("rep", [p[0] for p in pages()])
 def test_report(rep: str):
+    page = next(p[2] for p in pages() if p[0] == rep)
+    at = AppTest.from_function(page).run()
+    assert not at.exception
+    assert len(at.code[0].value) > 0
+
+
+def test_app():
     at = AppTest.from_file("app.py").run()
-    tab = next((t for t in at.tabs if t.label == rep))
-    assert len(tab.code[0].value) > 0
+    assert not at.exception
+    assert at.subheader[0].value == pages()[0][0]
+    assert len(at.subheader) == 1
+
+
+def test_panel_rerun():
+    at = AppTest.from_function(pages()[0][2]).run()
+    before = at.dataframe[0].value
+    at.number_input[0].set_value(10).run()
+    assert not at.exception
+    assert not at.dataframe[0].value.equals(before)
+
+
+def _switch():
+    import streamlit as st
+
+    from src.page import pages
+
+    pages()[st.session_state.get("page", 0)][2]()
+
+
+def test_inputs_survive_page_switch():
+    birth = datetime.date(datetime.date.today().year - 8, 1, 1)
+    at = AppTest.from_function(_switch).run()
+    at.number_input[0].set_value(10).run()
+    at.date_input[1].set_value(birth).run()
+
+    at.session_state["page"] = 2
+    at.run()
+    assert at.subheader[0].value == "MABC"
+    at.session_state["page"] = 0
+    at.run()
+
+    assert not at.exception
+    assert at.number_input[0].value == 10
+    assert at.date_input[1].value == birth
+
+
+def test_trace(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("REPORTUS_TRACE", "1")
+    try:
+        at = AppTest.from_file("app.py").run()
+    finally:
+        trace.disable()
+    assert not at.exception
+    assert at.expander[0].label == "Trace"
+    assert "dtvp.process" in at.json[0].value
+
+
+def test_trace_fragment():
+    # no app.py session around the page, as on a fragment-only rerun
+    trace.enable()
+    try:
+        at = AppTest.from_function(pages()[0][2]).run()
+        at.number_input[0].set_value(10).run()
+    finally:
+        trace.disable()
+    assert not at.exception
+    assert at.expander[0].label == "Trace"
+    assert "dtvp.process" in at.json[0].value
+
+
+def test_startup():
+    at = AppTest.from_file("app.py")
+    at.query_params["startup"] = "mabc"
+    at.run()
+    assert not at.exception
+    assert at.subheader[0].value == "MABC"
+    assert at.expander[-1].label == "Startup"
+    phases = {(p["phase"], p["name"]) for p in startup.rows()}
+    assert {("load", "src.report.mabc"), ("render", "mabc")} <= phases
+
+
+def test_startup_headless(capsys: pytest.CaptureFixture[str]):
+    assert startup.main(["spm", "--json"]) == 0
+    res = json.loads(capsys.readouterr().out)
+    assert [p["phase"] for p in res["spm"]][-2:] == ["render", "run"]
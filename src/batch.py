@@ -0,0 +1,222 @@
+import collections
+import concurrent.futures
+import csv
+import dataclasses
+import datetime
+import itertools
+import json
+import multiprocessing
+import os
+from typing import Any, Callable, Iterable, Iterator, Literal, TextIO
+
+from src import table, time
+from src.report import dtvp, dtvpa, mabc, spm
+
+Test = Literal["dtvp3", "dtvpa", "mabc", "spm"]
+Format = Literal["csv", "jsonl"]
+Row = dict[str, str]
+
+
+@dataclasses.dataclass(frozen=True)
+class Options:
+    hand: str = "Right"
+    form: spm.Form = "Home"
+    ver: spm.Version = 2
+
+
+@dataclasses.dataclass(frozen=True)
+class Scored:
+    child: str
+    tables: dict[str, table.Table[Any]]
+    report: str
+    error: str | None = None
+
+
+Scorer = Callable[[Row, Options], tuple[dict[str, table.Table[Any]], str]]
+
+
+def _cell(row: Row, k: str) -> str:
+    return (row.get(k) or "").strip()
+
+
+def _age(row: Row) -> tuple[datetime.date, time.Delta]:
+    asmt = time.parse_date(_cell(row, "asmt"))
+    return asmt, time.to_delta(time.parse_date(_cell(row, "birth")), asmt)
+
+
+def _ints(row: Row, keys: Iterable[str]) -> dict[str, int]:
+    return {k: int(_cell(row, k)) for k in keys}
+
+
+def _dtvp3(row: Row, _: Options) -> tuple[dict[str, table.Table[Any]], str]:
+    asmt, age = _age(row)
+    sub, comp, rep = dtvp.process(age, _ints(row, dtvp.get_tests()), asmt)
+    return {"sub": sub, "comp": comp}, rep
+
+
+def _dtvpa(row: Row, _: Options) -> tuple[dict[str, table.Table[Any]], str]:
+    asmt, age = _age(row)
+    sub, comp, rep = dtvpa.process(age, _ints(row, dtvpa.get_tests()), asmt)
+    return {"sub": sub, "comp": comp}, rep
+
+
+def _mabc(row: Row, opts: Options) -> tuple[dict[str, table.Table[Any]], str]:
+    asmt, age = _age(row)
+    raw: dict[str, int | None] = {}
+    for exes in mabc.get_comps(age).values():
+        for k in exes:
+            v = _cell(row, k)
+            raw[k] = int(v) if v else None
+    hand = _cell(row, "hand") or opts.hand
+    comp, agg, rep = mabc.process(age, raw, asmt, hand=hand)
+    return {"comp": comp, "agg": agg}, rep
+
+
+def _form(s: str) -> spm.Form:
+    if s == "Classroom":
+        return "Classroom"
+    if s == "Home":
+        return "Home"
+    raise ValueError(f"unknown SPM form {s!r}")
+
+
+def _version(s: str) -> spm.Version:
+    if s == "1":
+        return 1
+    if s == "2":
+        return 2
+    raise ValueError(f"unknown SPM version {s!r}")
+
+
+def _spm(row: Row, opts: Options) -> tuple[dict[str, table.Table[Any]], str]:
+    asmt = time.parse_date(_cell(row, "asmt"))
+    form = _form(_cell(row, "form") or opts.form)
+    ver = _version(_cell(row, "ver") or str(opts.ver))
+    filers = spm.filers(form)
+    name = _cell(row, "filer")
+    filer = next((f for f in filers if f.name == name), None) if name else filers[0]
+    if filer is None:
+        raise ValueError(f"unknown SPM filer {name!r}")
+    raw = _ints(row, spm.get_scores())
+    res, rep = spm.process(asmt, form, ver, filer, _cell(row, "name") or None, raw)
+    return {"result": res}, rep
+
+
+SCORERS: dict[Test, Scorer] = {
+    "dtvp3": _dtvp3,
+    "dtvpa": _dtvpa,
+    "mabc": _mabc,
+    "spm": _spm,
+}
+
+
+LOADERS: dict[Test, Callable[[], object]] = {
+    "dtvp3": dtvp._load,
+    "dtvpa": dtvpa._load,
+    "mabc": mabc._load,
+    "spm": spm._load,
+}
+
+
+def read(f: TextIO) -> Iterator[Row]:
+    yield from csv.DictReader(f)
+
+
+def score(
+    rows: Iterable[Row], test: Test, opts: Options = Options(), start: int = 1
+) -> Iterator[Scored]:
+    scorer = SCORERS[test]
+    for n, row in enumerate(rows, start=start):
+        child = _cell(row, "child") or str(n)
+        try:
+            tables, rep = scorer(row, opts)
+        except (LookupError, ValueError) as e:
+            yield Scored(child, {}, "", f"{type(e).__name__}: {e}")
+            continue
+        yield Scored(child, tables, rep)
+
+
+def _init_worker(test: Test) -> None:
+    LOADERS[test]()
+
+
+def _score_chunk(
+    test: Test, opts: Options, rows: list[Row], start: int
+) -> list[Scored]:
+    return list(score(rows, test, opts, start))
+
+
+def score_parallel(
+    rows: Iterable[Row],
+    test: Test,
+    opts: Options = Options(),
+    workers: int = 0,
+    chunk_size: int = 256,
+) -> Iterator[Scored]:
+    if workers < 0:
+        raise ValueError(f"workers must be >= 0, got {workers}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+    return _score_parallel(rows, test, opts, workers or os.cpu_count() or 1, chunk_size)
+
+
+def _score_parallel(
+    rows: Iterable[Row], test: Test, opts: Options, workers: int, chunk_size: int
+) -> Iterator[Scored]:
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(test,),
+    ) as pool:
+        limit = 2 * workers
+        pending: collections.deque[concurrent.futures.Future[list[Scored]]] = (
+            collections.deque()
+        )
+        it = iter(rows)
+        start = 1
+        while chunk := list(itertools.islice(it, chunk_size)):
+            pending.append(pool.submit(_score_chunk, test, opts, chunk, start))
+            start += len(chunk)
+            if len(pending) >= limit:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def write_csv(results: Iterable[Scored], out: TextIO) -> int:
+    writer = csv.writer(out)
+    writer.writerow(["child", "table", "id", "field", "value"])
+    errors = 0
+    for s in results:
+        if s.error is not None:
+            errors += 1
+            writer.writerow([s.child, "error", "", "message", s.error])
+            continue
+        for name, t in s.tables.items():
+            for d in t.to_dicts():
+                for k, v in d.items():
+                    if k != "id":
+                        writer.writerow([s.child, name, d["id"], k, v])
+        writer.writerow([s.child, "report", "", "text", s.report])
+    return errors
+
+
+def write_jsonl(results: Iterable[Scored], out: TextIO) -> int:
+    errors = 0
+    for s in results:
+        rec: dict[str, Any] = {"child": s.child}
+        if s.error is not None:
+            errors += 1
+            rec["error"] = s.error
+        else:
+            rec["tables"] = {k: t.to_dicts() for k, t in s.tables.items()}
+            rec["report"] = s.report
+        out.write(json.dumps(rec, ensure_ascii=False) + "\n")
+    return errors
+
+
+WRITERS: dict[Format, Callable[[Iterable[Scored], TextIO], int]] = {
+    "csv": write_csv,
+    "jsonl": write_jsonl,
+}
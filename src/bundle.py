@@ -0,0 +1,55 @@
+import ast
+import os
+import zipfile
+
+from src import pack
+
+BUNDLE = "bundle.zip"
+ENTRY = "app.py"
+DATE = (1980, 1, 1, 0, 0, 0)
+
+
+def _path(module: str) -> str | None:
+    base = module.replace(".", "/")
+    for p in [f"{base}.py", f"{base}/__init__.py"]:
+        if os.path.exists(p):
+            return p
+    return None
+
+
+def _imports(path: str) -> set[str]:
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    found: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            found.update(a.name for a in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            found.add(node.module)
+            found.update(f"{node.module}.{a.name}" for a in node.names)
+    return found
+
+
+def files(entry: str = ENTRY) -> list[str]:
+    seen = {entry}
+    todo = [entry]
+    while todo:
+        for module in _imports(todo.pop()):
+            parts = module.split(".")
+            for i in range(1, len(parts) + 1):
+                path = _path(".".join(parts[:i]))
+                if path is not None and path not in seen:
+                    seen.add(path)
+                    todo.append(path)
+    return sorted(seen) + [pack.PACK]
+
+
+def build(out: str = BUNDLE, entry: str = ENTRY) -> list[str]:
+    names = files(entry)
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED, compresslevel=9) as z:
+        for name in names:
+            info = zipfile.ZipInfo(name, DATE)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with open(name, "rb") as f:
+                z.writestr(info, f.read())
+    return names
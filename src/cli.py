@@ -0,0 +1,125 @@
+import argparse
+import contextlib
+import glob
+import json
+import os
+import sys
+import typing
+from typing import Callable, TextIO
+
+from src import batch, bundle, integrity, pack
+
+
+def _at_least(n: int) -> Callable[[str], int]:
+    def parse(s: str) -> int:
+        v = int(s)
+        if v < n:
+            raise argparse.ArgumentTypeError(f"must be at least {n}, got {v}")
+        return v
+
+    return parse
+
+
+def _score(args: argparse.Namespace) -> int:
+    opts = batch.Options(hand=args.hand, form=args.form, ver=args.ver)
+    with contextlib.ExitStack() as stack:
+        inp: TextIO = stack.enter_context(open(args.input, newline=""))
+        out: TextIO = (
+            stack.enter_context(open(args.output, "w", newline=""))
+            if args.output
+            else sys.stdout
+        )
+        rows = batch.read(inp)
+        results = (
+            batch.score(rows, args.test, opts)
+            if args.workers == 1
+            else batch.score_parallel(
+                rows, args.test, opts, args.workers, args.chunk_size
+            )
+        )
+        errors = batch.WRITERS[args.format](results, out)
+
+    if errors:
+        print(f"{errors} rows could not be scored", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _pack(args: argparse.Namespace) -> int:
+    paths = [os.path.abspath(p) for p in args.csv] or sorted(
+        glob.glob("public/*.csv", root_dir=pack.ROOT)
+    )
+    out = os.path.abspath(args.output) if args.output else pack.resolve(pack.PACK)
+    digest = pack.build(paths, out)
+    print(f"{pack.key(out)} {digest}")
+    return 0
+
+
+def _bundle(args: argparse.Namespace) -> int:
+    names = bundle.build(args.output, args.entry)
+    print(f"{args.output} {len(names)} files")
+    return 0
+
+
+def _check(args: argparse.Namespace) -> int:
+    rep = integrity.report(workers=args.workers)
+    with contextlib.ExitStack() as stack:
+        out: TextIO = (
+            stack.enter_context(open(args.output, "w")) if args.output else sys.stdout
+        )
+        json.dump(rep, out, indent=2)
+        out.write("\n")
+    if not rep["ok"]:
+        print(f"{len(rep['defects'])} norm table defects", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="reportus")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    score = commands.add_parser("score", help="score a cohort from a CSV file")
+    score.add_argument("test", choices=typing.get_args(batch.Test))
+    score.add_argument("input", help="CSV with one child per row")
+    score.add_argument("-o", "--output", help="output file (default: stdout)")
+    score.add_argument(
+        "-f", "--format", choices=typing.get_args(batch.Format), default="csv"
+    )
+    score.add_argument("--hand", choices=["Right", "Left"], default="Right")
+    score.add_argument("--form", choices=["Classroom", "Home"], default="Home")
+    score.add_argument("--ver", type=int, choices=[1, 2], default=2)
+    score.add_argument(
+        "-w",
+        "--workers",
+        type=_at_least(0),
+        default=1,
+        help="worker processes, 0 for one per CPU (default: 1)",
+    )
+    score.add_argument("--chunk-size", type=_at_least(1), default=256)
+    score.set_defaults(func=_score)
+
+    packer = commands.add_parser("pack", help="precompile norm tables")
+    packer.add_argument("csv", nargs="*", help="CSV files (default: public/*.csv)")
+    packer.add_argument("-o", "--output", help=f"default: {pack.PACK}")
+    packer.set_defaults(func=_pack)
+
+    bundler = commands.add_parser("bundle", help="pack the app into one archive")
+    bundler.add_argument("-o", "--output", default=bundle.BUNDLE)
+    bundler.add_argument("--entry", default=bundle.ENTRY)
+    bundler.set_defaults(func=_bundle)
+
+    check = commands.add_parser("check", help="check norm table integrity")
+    check.add_argument("-o", "--output", help="JSON report file (default: stdout)")
+    check.add_argument("-w", "--workers", type=_at_least(0), default=1)
+    check.set_defaults(func=_check)
+
+    args = parser.parse_args(argv)
+    try:
+        return args.func(args)
+    except OSError as e:
+        parser.exit(2, f"reportus: error: {e}\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+import collections
+import concurrent.futures
+import dataclasses
+import importlib
+import math
+import multiprocessing
+import os
+import typing
+from typing import Callable, Hashable, Iterable, Literal, Sequence
+
+Kind = Literal["gap", "overlap", "duplicate", "order", "value"]
+Span = tuple[float, float]
+
+
+@dataclasses.dataclass(frozen=True)
+class Defect:
+    table: str
+    key: str
+    kind: Kind
+    axis: str
+    lo: float
+    hi: float
+    age: Span | None = None
+
+    @typing.override
+    def __str__(self) -> str:
+        where = f"{self.axis} {self.lo:g}..{self.hi:g}"
+        if self.age is not None:
+            where += f" at age {self.age[0]:g}..{self.age[1]:g}"
+        return f"{self.table}: {self.kind} for {self.key} {where}"
+
+
+@dataclasses.dataclass(frozen=True)
+class Spec[T]:
+    name: str
+    rows: Callable[[], Sequence[T]]
+    key: Callable[[T], Hashable]
+    raw: Callable[[T], Span]
+    raw_domain: Callable[[Hashable], Span]
+    age: Callable[[T], Span] | None = None
+    age_domain: Callable[[Hashable], Span] | None = None
+    keys: Sequence[Hashable] = ()
+    check: Callable[[T], bool] = lambda _: True
+    exact: bool = False
+    monotonic: Sequence[str] = ()
+
+
+def closed(lo: float, hi: float) -> Span:
+    return lo, hi
+
+
+def half_open(lo: float, hi: float) -> Span:
+    return lo, hi - 1 if math.isfinite(hi) else hi
+
+
+def sweep(spans: Iterable[Span], domain: Span) -> list[tuple[Kind, Span]]:
+    lo, hi = domain
+    covered = lo - 1
+    found: list[tuple[Kind, Span]] = []
+    for a, b in sorted(spans):
+        if a <= covered:
+            found.append(("overlap", (a, min(b, covered))))
+        elif a > covered + 1 and covered < hi:
+            found.append(("gap", (covered + 1, min(a - 1, hi))))
+        covered = max(covered, b)
+    if covered < hi:
+        found.append(("gap", (covered + 1, hi)))
+    return found
+
+
+def flips(values: Sequence[float]) -> list[int]:
+    trend = values[-1] - values[0] if values else 0
+    return [i for i in range(1, len(values)) if (values[i] - values[i - 1]) * trend < 0]
+
+
+def check[T](spec: Spec[T]) -> list[Defect]:
+    groups: dict[Hashable, dict[Span | None, list[T]]] = collections.defaultdict(
+        lambda: collections.defaultdict(list)
+    )
+    defects: list[Defect] = []
+
+    for row in spec.rows():
+        age = None if spec.age is None else spec.age(row)
+        groups[spec.key(row)][age].append(row)
+        if not spec.check(row):
+            lo, hi = spec.raw(row)
+            defects.append(
+                Defect(spec.name, str(spec.key(row)), "value", "raw", lo, hi, age)
+            )
+
+    for key in spec.keys:
+        if key not in groups:
+            lo, hi = (
+                spec.raw_domain(key)
+                if spec.age_domain is None
+                else spec.age_domain(key)
+            )
+            axis = "raw" if spec.age_domain is None else "age"
+            defects.append(Defect(spec.name, str(key), "gap", axis, lo, hi))
+
+    for key, bands in groups.items():
+        if spec.age_domain is not None:
+            ages = [a for a in bands if a is not None]
+            for kind, (lo, hi) in sweep(ages, spec.age_domain(key)):
+                defects.append(Defect(spec.name, str(key), kind, "age", lo, hi))
+        for age, rows in bands.items():
+            for kind, (lo, hi) in sweep(map(spec.raw, rows), spec.raw_domain(key)):
+                if kind == "overlap" and spec.exact:
+                    kind = "duplicate"
+                defects.append(Defect(spec.name, str(key), kind, "raw", lo, hi, age))
+            rows = sorted(rows, key=spec.raw)
+            for field in spec.monotonic:
+                for i in flips([getattr(r, field) for r in rows]):
+                    lo, hi = spec.raw(rows[i])
+                    defects.append(
+                        Defect(spec.name, str(key), "order", field, lo, hi, age)
+                    )
+
+    return defects
+
+
+def _check_named(module: str, name: str) -> list[Defect]:
+    return check(importlib.import_module(module).specs()[name])
+
+
+def run_all(tasks: Sequence[tuple[str, str]], workers: int = 1) -> list[Defect]:
+    if workers == 1 or len(tasks) <= 1:
+        return [d for m, n in tasks for d in _check_named(m, n)]
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=min(workers or os.cpu_count() or 1, len(tasks)),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as pool:
+        results = pool.map(_check_named, *zip(*tasks))
+        return [d for ds in results for d in ds]
+
+
+def run(
+    module: str, names: Sequence[str] | None = None, workers: int = 1
+) -> list[Defect]:
+    if names is None:
+        names = list(importlib.import_module(module).specs())
+    return run_all([(module, n) for n in names], workers)
+
+
+def validate(module: str, names: Sequence[str] | None = None, workers: int = 1):
+    defects = run(module, names, workers)
+    assert not defects, "\n".join(map(str, defects))
@@ -0,0 +1,27 @@
+import dataclasses
+import importlib
+from typing import Any
+
+from src import coverage
+
+MODULES = [
+    "src.report.dtvp",
+    "src.report.dtvpa",
+    "src.report.mabc",
+    "src.report.spm",
+]
+
+
+def report(modules: list[str] = MODULES, workers: int = 1) -> dict[str, Any]:
+    tasks = [(m, n) for m in modules for n in importlib.import_module(m).specs()]
+    defects = coverage.run_all(tasks, workers)
+
+    tables: dict[str, dict[str, int]] = {n: {} for _, n in tasks}
+    for d in defects:
+        tables[d.table][d.kind] = tables[d.table].get(d.kind, 0) + 1
+
+    return {
+        "ok": not defects,
+        "tables": tables,
+        "defects": [dataclasses.asdict(d) for d in defects],
+    }
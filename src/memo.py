@@ -0,0 +1,100 @@
+import collections
+import dataclasses
+import functools
+import inspect
+import threading
+import weakref
+from typing import Any, Callable, Hashable
+
+from src import registry
+
+MAXSIZE = 256
+
+
+@dataclasses.dataclass(frozen=True)
+class Stats:
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+def _freeze(v: Any) -> Hashable:
+    if isinstance(v, dict):
+        return (dict, tuple(sorted((k, _freeze(x)) for k, x in v.items())))
+    if isinstance(v, (list, tuple)):
+        return (type(v), tuple(_freeze(x) for x in v))
+    if isinstance(v, (set, frozenset)):
+        return (type(v), frozenset(_freeze(x) for x in v))
+    return v
+
+
+class Memo[**P, R]:
+    def __init__(self, fn: Callable[P, R], maxsize: int = MAXSIZE):
+        functools.update_wrapper(self, fn)
+        self.fn = fn
+        self.maxsize = maxsize
+        self._sig = inspect.signature(fn)
+        self._data: collections.OrderedDict[Hashable, R] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        _memos.add(self)
+
+    def key(self, *args: P.args, **kwargs: P.kwargs) -> Hashable:
+        bound = self._sig.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return _freeze(bound.arguments)
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        try:
+            key = self.key(*args, **kwargs)
+            hash(key)
+        except TypeError:
+            with self._lock:
+                self._misses += 1
+            return self.fn(*args, **kwargs)
+
+        with self._lock:
+            if key in self._data:
+                self._hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]
+            self._misses += 1
+
+        res = self.fn(*args, **kwargs)
+
+        with self._lock:
+            self._data[key] = res
+            self._data.move_to_end(key)
+            while len(self._data) > max(self.maxsize, 0):
+                self._data.popitem(last=False)
+        return res
+
+    def stats(self) -> Stats:
+        with self._lock:
+            return Stats(self._hits, self._misses, len(self._data), self.maxsize)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+_memos: weakref.WeakSet[Memo[..., Any]] = weakref.WeakSet()
+
+
+def clear_all() -> None:
+    for m in list(_memos):
+        m.clear()
+
+
+registry.subscribe(clear_all)
+
+
+def lru[**P, R](maxsize: int = MAXSIZE) -> Callable[[Callable[P, R]], Memo[P, R]]:
+    def wrap(fn: Callable[P, R]) -> Memo[P, R]:
+        return Memo(fn, maxsize)
+
+    return wrap
@@ -0,0 +1,237 @@
+import array
+import csv
+import dataclasses
+import functools
+import hashlib
+import io
+import json
+import mmap
+import os
+import pathlib
+import struct
+import sys
+import typing
+from typing import Any, Sequence
+
+from src import table
+
+PKG = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(PKG)
+PACK = "public/norms.bin"
+MAGIC = b"REPORTUS"
+VERSION = 1
+
+Kind = typing.Literal["int", "float", "str"]
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _kind(values: list[str]) -> Kind:
+    try:
+        for v in values:
+            int(v)
+        return "int"
+    except ValueError:
+        pass
+    try:
+        for v in values:
+            float(v)
+        return "float"
+    except ValueError:
+        return "str"
+
+
+def _array(kind: Kind, values: list[Any]) -> array.array[Any]:
+    codes = "hiq" if kind == "int" else "fd"
+    for code in codes:
+        try:
+            arr = array.array(code, values)
+        except OverflowError:
+            continue
+        if list(arr) == values:
+            return arr
+    return array.array(codes[-1], values)
+
+
+def _pad(buf: bytes) -> bytes:
+    return buf + b"\0" * (-len(buf) % 8)
+
+
+def build(paths: list[str], out: str = PACK) -> str:
+    strings: dict[str, int] = {}
+    tables: dict[str, Any] = {}
+    body = bytearray()
+    total = hashlib.sha256()
+
+    for path in sorted(paths, key=key):
+        with open(resolve(path), "rb") as f:
+            data = f.read()
+        path = key(path)
+        total.update(path.encode() + b"\0" + data)
+
+        reader = csv.reader(io.StringIO(data.decode()))
+        header = next(reader)
+        rows = [r for r in reader if r]
+
+        columns: list[dict[str, Any]] = []
+        for j, name in enumerate(header):
+            raw = [r[j] for r in rows]
+            kind = _kind(raw)
+            if kind == "int":
+                values: list[Any] = [int(v) for v in raw]
+            elif kind == "float":
+                values = [float(v) for v in raw]
+            else:
+                values = [strings.setdefault(v, len(strings)) for v in raw]
+            arr = _array("int" if kind == "str" else kind, values)
+            columns.append(
+                {"name": name, "kind": kind, "code": arr.typecode, "offset": len(body)}
+            )
+            body += _pad(arr.tobytes())
+
+        tables[path] = {
+            "hash": _digest(data),
+            "size": len(data),
+            "rows": len(rows),
+            "columns": columns,
+        }
+
+    meta = json.dumps(
+        {
+            "version": VERSION,
+            "byteorder": sys.byteorder,
+            "hash": total.hexdigest(),
+            "strings": list(strings),
+            "tables": tables,
+        },
+        separators=(",", ":"),
+    ).encode()
+
+    with open(resolve(out), "wb") as f:
+        f.write(MAGIC + _pad(struct.pack("<I", len(meta)) + meta) + body)
+
+    return total.hexdigest()
+
+
+def resolve(path: str) -> str:
+    full = os.path.join(ROOT, path)
+    if not os.path.exists(full):
+        # installed wheels ship norms.bin inside the package
+        packaged = os.path.join(PKG, path)
+        if os.path.exists(packaged):
+            return packaged
+    return full
+
+
+def key(path: str) -> str:
+    full = os.path.normpath(os.path.join(ROOT, path))
+    rel = os.path.relpath(full, ROOT)
+    return pathlib.PurePath(full if rel.startswith("..") else rel).as_posix()
+
+
+class Strings(Sequence[str]):
+    def __init__(self, codes: memoryview, strings: list[str]):
+        self.codes = codes
+        self.strings = strings
+
+    @typing.override
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @typing.overload
+    def __getitem__(self, i: int) -> str: ...
+
+    @typing.overload
+    def __getitem__(self, i: slice) -> list[str]: ...
+
+    @typing.override
+    def __getitem__(self, i: int | slice) -> str | list[str]:
+        if isinstance(i, slice):
+            return [self.strings[j] for j in self.codes[i]]
+        return self.strings[self.codes[i]]
+
+
+@dataclasses.dataclass(frozen=True)
+class Pack:
+    meta: dict[str, Any]
+    body: memoryview
+    built: int = 0
+
+    def columns(self, path: str) -> dict[str, Sequence[Any]] | None:
+        entry = self.meta["tables"].get(key(path))
+        if entry is None:
+            return None
+        n = entry["rows"]
+        cols: dict[str, Sequence[Any]] = {}
+        for c in entry["columns"]:
+            size = array.array(c["code"]).itemsize
+            view = self.body[c["offset"] : c["offset"] + n * size].cast(c["code"])
+            if c["kind"] == "str":
+                cols[c["name"]] = Strings(view, self.meta["strings"])
+            else:
+                cols[c["name"]] = view
+        return cols
+
+    def stale(self, path: str) -> bool:
+        entry = self.meta["tables"].get(key(path))
+        if entry is None:
+            return True
+        path = resolve(path)
+        try:
+            st = os.stat(path)
+            # per-file mtimes would make norms.bin differ on every checkout
+            if st.st_size == entry.get("size") and st.st_mtime_ns < self.built:
+                return False
+            with open(path, "rb") as f:
+                return _digest(f.read()) != entry["hash"]
+        except OSError:
+            return False
+
+
+def parse(data: bytes | mmap.mmap) -> Pack | None:
+    view = memoryview(data)
+    if bytes(view[: len(MAGIC)]) != MAGIC:
+        return None
+    (size,) = struct.unpack_from("<I", view, len(MAGIC))
+    start = len(MAGIC) + 4
+    meta = json.loads(bytes(view[start : start + size]))
+    if meta["version"] != VERSION or meta["byteorder"] != sys.byteorder:
+        return None
+    body = start + size + (-(4 + size) % 8)
+    return Pack(meta=meta, body=view[body:])
+
+
+@functools.cache
+def open_pack(path: str = PACK, mapped: bool = False) -> Pack | None:
+    path = resolve(path)
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if mapped else f.read()
+        p = parse(data)
+        if p is None:
+            return None
+        return dataclasses.replace(p, built=os.fstat(f.fileno()).st_mtime_ns)
+
+
+def read_csv[T: table.DataclassInstance](
+    path: str, cls: type[T], pack: str = PACK, mapped: bool = False
+) -> table.Table[T]:
+    p = open_pack(pack, mapped)
+    cols = None if p is None or p.stale(path) else p.columns(path)
+    fields = dataclasses.fields(cls)
+    if cols is None or any(f.name not in cols for f in fields):
+        return table.read_csv(resolve(path), cls)
+
+    hints = typing.get_type_hints(cls)
+    for f in fields:
+        col = cols[f.name]
+        hint = hints[f.name]
+        if col and not isinstance(col[0], hint):
+            cols[f.name] = [hint(v) for v in col]
+
+    if mapped:
+        return table.Table(table.Columns(cls, cols))
+    return table.Table([cls(*v) for v in zip(*(cols[f.name] for f in fields))])
@@ -0,0 +1,34 @@
+from typing import Callable
+
+
+def dtvp3_page():
+    from src.page import dtvp
+
+    dtvp.page("dtvp3")
+
+
+def dtvpa_page():
+    from src.page import dtvp
+
+    dtvp.page("dtvpa")
+
+
+def mabc_page():
+    from src.page import mabc
+
+    mabc.page()
+
+
+def spm_page():
+    from src.page import spm
+
+    spm.page()
+
+
+def pages() -> list[tuple[str, str, Callable[[], None]]]:
+    return [
+        ("DTVP-3", "dtvp3", dtvp3_page),
+        ("DTVP-A", "dtvpa", dtvpa_page),
+        ("MABC", "mabc", mabc_page),
+        ("SPM", "spm", spm_page),
+    ]
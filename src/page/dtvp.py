@@ -1,39 +1,47 @@
+import datetime
 import typing
 
 import streamlit as st
 
 from src import ui
-from src.report import dtvp, dtvpa
+from src.time import Delta
 
+Rep = typing.Literal["dtvp3", "dtvpa"]
 
-def page(rep: typing.Literal["dtvp3", "dtvpa"]) -> None:
+
+def page(rep: Rep) -> None:
     if rep == "dtvp3":
         title = "DTVP-3"
         min_age = 4
         max_age = 13
-        get_tests = dtvp.get_tests
-        process = dtvp.process
     else:
         title = "DTVP-A"
         min_age = 11
         max_age = 18
-        get_tests = dtvpa.get_tests
-        process = dtvpa.process
 
-    hori, vert = ui.structure(title)
+    hori, _ = ui.structure(title)
 
     with hori():
-        with vert():
-            asmt_date, _, age = ui.dates(min_age, max_age, key=rep)
+        asmt_date, _, age = ui.dates(min_age, max_age, key=rep)
 
-            raw: dict[str, int] = {}
-            tests = get_tests()
+    panel(rep, age, asmt_date)
 
-            for k, v in tests.items():
-                raw[k] = st.number_input(v, step=1)
 
-        with vert():
-            sub, comp, report = process(age, raw, asmt_date)
-            ui.text(report)
+@ui.fragment
+def panel(rep: Rep, age: Delta, asmt_date: datetime.date) -> None:
+    if rep == "dtvp3":
+        from src.report import dtvp as report
+    else:
+        from src.report import dtvpa as report
+
+    with ui.hori():
+        with ui.vert():
+            raw: dict[str, int] = {}
+            for k, v in report.get_tests().items():
+                raw[k] = ui.kept(st.number_input)(v, step=1, key=f"{rep}_{k}")
+
+        with ui.vert():
+            sub, comp, text = report.process(age, raw, asmt_date)
+            ui.text(text)
             ui.table(sub, hide_cols=["id"])
             ui.table(comp)
@@ -1,3 +1,4 @@
+import datetime
 import typing
 
 import streamlit as st
@@ -16,19 +17,33 @@ def display_age(a: Delta) -> ui.Color:
 
 
 def page():
-    hori, vert = ui.structure("MABC")
+    hori, _ = ui.structure("MABC")
 
     with hori():
-        with vert():
-            asmt_date, _, age = ui.dates(5, 16, disp=display_age, key="mabc")
+        asmt_date, _, age = ui.dates(5, 16, disp=display_age, key="mabc")
+
+    panel(age, asmt_date)
+
+
+@ui.fragment
+def panel(age: Delta, asmt_date: datetime.date) -> None:
+    hori, vert = ui.hori, ui.vert
 
+    with hori():
+        with vert():
             comps = mabc.get_comps(age)
             comp_ids = list(comps.keys())
 
             with hori():
-                hand = st.selectbox("Preferred Hand", ("Right", "Left"))
-                failed = st.multiselect(
-                    "Failed", mabc.get_failed(), format_func=str.upper, width=400
+                hand = ui.kept(st.selectbox)(
+                    "Preferred Hand", ("Right", "Left"), key="mabc_hand"
+                )
+                failed = ui.kept(st.multiselect)(
+                    "Failed",
+                    mabc.get_failed(),
+                    format_func=str.upper,
+                    width=400,
+                    key="mabc_failed",
                 )
 
             raw: dict[str, typing.Optional[int]] = {}
@@ -38,8 +53,9 @@ def page():
                     with vert():
                         st.markdown(f"**{comp_id}**")
                         for exe in comps[comp_id]:
-                            raw[exe] = st.number_input(
+                            raw[exe] = ui.kept(st.number_input)(
                                 label=exe.upper(),
+                                key=f"mabc_{exe}",
                                 min_value=0,
                                 max_value=150,
                                 step=1,
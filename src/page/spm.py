@@ -14,20 +14,32 @@ def page():
         with vert():
             today = datetime.date.today()
 
-            def ver1():
-                return ver == 1
-
             with hori():
                 asmt = ui.date_input("Assessment", today, key="spm", max_value=today)
             with hori():
-                ver: Literal[1, 2] = st.selectbox("Version", (1, 2))
-                form = st.selectbox("Form", spm.forms(ver))
-                filer = st.selectbox(
+                ver: Literal[1, 2] = ui.kept(st.selectbox)(
+                    "Version", (1, 2), key="spm_ver"
+                )
+                form = ui.kept(st.selectbox)("Form", spm.forms(ver), key="spm_form")
+                filer = ui.kept(st.selectbox)(
                     "Filled by",
                     spm.filers(form),
                     format_func=lambda f: f.name,
+                    key="spm_filer",
                 )
 
+    panel(asmt, ver, form, filer)
+
+
+@ui.fragment
+def panel(asmt: datetime.date, ver: spm.Version, form: spm.Form, filer: spm.Filer):
+    hori, vert = ui.hori, ui.vert
+
+    def ver1():
+        return ver == 1
+
+    with hori():
+        with vert():
             scores = spm.get_scores()
 
             left_forms = (
@@ -44,15 +56,19 @@ def page():
             with hori():
                 with vert():
                     for s in left_forms:
-                        raw[s] = st.number_input(scores[s], step=1)
+                        raw[s] = ui.kept(st.number_input)(
+                            scores[s], step=1, key=f"spm_{s}"
+                        )
 
                 with vert():
                     for s in right_forms:
-                        raw[s] = st.number_input(scores[s], step=1)
+                        raw[s] = ui.kept(st.number_input)(
+                            scores[s], step=1, key=f"spm_{s}"
+                        )
 
             name = None
             if not ver1():
-                name = st.text_input("Name")
+                name = ui.kept(st.text_input)("Name", key="spm_name")
 
         with vert():
             res, rep = spm.process(asmt, form, ver, filer, name, raw)
@@ -0,0 +1,73 @@
+import threading
+from typing import Any, Callable
+
+
+class Registry:
+    def __init__(self):
+        self._values: dict[str, Any] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get[T](self, name: str, load: Callable[[], T]) -> T:
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        with self._lock:
+            lock = self._locks.setdefault(name, threading.Lock())
+        with lock:
+            if name not in self._values:
+                self._values[name] = load()
+            return self._values[name]
+
+    def loaded(self) -> list[str]:
+        return list(self._values)
+
+    def invalidate(self, name: str | None = None) -> None:
+        with self._lock:
+            if name is None:
+                self._values.clear()
+            else:
+                self._values.pop(name, None)
+
+
+_registry = Registry()
+_listeners: list[Callable[[], None]] = []
+
+
+def current() -> Registry:
+    return _registry
+
+
+def use(registry: Registry) -> Registry:
+    global _registry
+    prev, _registry = _registry, registry
+    for fn in _listeners:
+        fn()
+    return prev
+
+
+def invalidate(name: str | None = None) -> None:
+    _registry.invalidate(name)
+    for fn in _listeners:
+        fn()
+
+
+def subscribe(fn: Callable[[], None]) -> None:
+    _listeners.append(fn)
+
+
+class Norms[T]:
+    def __init__(self, load: Callable[[], T]):
+        self.load = load
+        self.name = f"{load.__module__}.{load.__qualname__}"
+
+    def __call__(self) -> T:
+        return _registry.get(self.name, self.load)
+
+    def invalidate(self) -> None:
+        invalidate(self.name)
+
+
+def cached[T](load: Callable[[], T]) -> Norms[T]:
+    return Norms(load)
@@ -1,11 +1,11 @@
 import dataclasses
 import datetime
-import itertools
+import typing
 
-from src import string, table, time, ui
+from src import coverage, memo, pack, registry, string, table, time
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class RawAge:
     id: str
     raw_min: int
@@ -14,7 +14,7 @@ class RawAge:
     age_eq_m: int
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class RawSca:
     id: str
     age_min_y: int
@@ -27,7 +27,7 @@ class RawSca:
     percentile: int
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ScaPer:
     id: str
     scaled: int
@@ -35,63 +35,83 @@ class ScaPer:
     index: int
 
 
-@ui.cache
-def _load() -> tuple[table.Table[RawAge], table.Table[RawSca], table.Table[ScaPer]]:
-    ra = table.read_csv("public/dtvp-raw-ageeq.csv", RawAge)
-    rs = table.read_csv("public/dtvp-raw-sca.csv", RawSca)
-    sp = table.read_csv("public/dtvp-sca-per.csv", ScaPer)
-    return ra, rs, sp
+@registry.cached
+def _load() -> tuple[table.Table[RawAge], table.Dense[RawSca], table.Dense[ScaPer]]:
+    ra = pack.read_csv("public/dtvp-raw-ageeq.csv", RawAge)
+    rs = pack.read_csv("public/dtvp-raw-sca.csv", RawSca)
+    sp = pack.read_csv("public/dtvp-sca-per.csv", ScaPer)
+    dense_rs = table.dense(
+        rs,
+        key=lambda r: r.id,
+        age=lambda r: (r.age_min_y * 12 + r.age_min_m, r.age_max_y * 12 + r.age_max_m),
+        unique=True,
+    )
+    dense_sp = table.dense(
+        sp, key=lambda r: r.id, raw=("scaled", "scaled"), unique=True
+    )
+    return ra, dense_rs, dense_sp
 
 
 def _get_ra(data: table.Table[RawAge], i: str, raw: int) -> RawAge:
     return data.filter(
         id=i,
-        raw_min=lambda v: v <= raw,
-        raw_max=lambda v: v >= raw,
+        raw_min=table.le(raw),
+        raw_max=table.ge(raw),
     ).item()
 
 
-def _get_rs(data: table.Table[RawSca], i: str, age: time.Delta, raw: int) -> RawSca:
-    months = age.years * 12 + age.months
-    matching = [
-        r
-        for r in data.rows
-        if r.id == i
-        and r.raw_min <= raw
-        and r.raw_max >= raw
-        and (r.age_min_y * 12 + r.age_min_m) <= months
-        and (r.age_max_y * 12 + r.age_max_m) >= months
-    ]
-    return matching[0]
+def _get_rs(data: table.Dense[RawSca], i: str, age: time.Delta, raw: int) -> RawSca:
+    return data.get(i, raw, age.years * 12 + age.months)
 
 
-def _get_sp(data: table.Table[ScaPer], i: str, s: int) -> ScaPer:
-    return data.filter(id=i, scaled=s).item()
+def _get_sp(data: table.Dense[ScaPer], i: str, s: int) -> ScaPer:
+    return data.get(i, s)
 
 
-def validate():
-    ra, rs, sp = _load()
-
-    for i, r in itertools.product(get_tests().keys(), range(0, 188)):
-        row = _get_ra(ra, i, r)
-        assert row.age_eq_y >= 0
-        assert row.age_eq_m >= 0
+def specs() -> dict[str, coverage.Spec[typing.Any]]:
+    tests = list(get_tests())
+    sums = {"vmi": (2, 40), "mrvp": (3, 59), "gvp": (5, 98)}
+    return {
+        "dtvp-raw-ageeq": coverage.Spec[RawAge](
+            "dtvp-raw-ageeq",
+            rows=lambda: _load()[0].rows,
+            key=lambda r: r.id,
+            raw=lambda r: coverage.closed(r.raw_min, r.raw_max),
+            raw_domain=lambda _: (0, 187),
+            keys=tests,
+            check=lambda r: r.age_eq_y >= 0 and r.age_eq_m >= 0,
+            monotonic=["age_eq_y"],
+        ),
+        "dtvp-raw-sca": coverage.Spec[RawSca](
+            "dtvp-raw-sca",
+            rows=lambda: _load()[1].source.rows,
+            key=lambda r: r.id,
+            raw=lambda r: coverage.closed(r.raw_min, r.raw_max),
+            raw_domain=lambda _: (0, 193),
+            age=lambda r: coverage.closed(
+                r.age_min_y * 12 + r.age_min_m, r.age_max_y * 12 + r.age_max_m
+            ),
+            age_domain=lambda _: (4 * 12, 12 * 12 + 11),
+            keys=tests,
+            check=lambda r: r.scaled > 0 and r.percentile >= 0,
+            monotonic=["scaled", "percentile"],
+        ),
+        "dtvp-sca-per": coverage.Spec[ScaPer](
+            "dtvp-sca-per",
+            rows=lambda: _load()[2].source.rows,
+            key=lambda r: r.id,
+            raw=lambda r: coverage.closed(r.scaled, r.scaled),
+            raw_domain=lambda i: sums[str(i)],
+            keys=list(sums),
+            check=lambda r: r.percentile >= 0 and r.index > 0,
+            exact=True,
+            monotonic=["percentile", "index"],
+        ),
+    }
 
-    for i, y, m, r in itertools.product(
-        get_tests().keys(), range(4, 13), range(0, 12, 2), range(0, 194)
-    ):
-        row = _get_rs(rs, i, time.Delta(years=y, months=m), r)
-        assert row.scaled > 0
-        assert row.percentile >= 0
 
-    for i, su in itertools.chain(
-        itertools.product(["vmi"], range(2, 41)),
-        itertools.product(["mrvp"], range(3, 60)),
-        itertools.product(["gvp"], range(5, 99)),
-    ):
-        row = _get_sp(sp, i, su)
-        assert row.percentile >= 0
-        assert row.index > 0
+def validate(workers: int = 1):
+    coverage.validate(__name__, workers=workers)
 
 
 def get_tests() -> dict[str, str]:
@@ -161,7 +181,7 @@ def to_age(a: str) -> str:
     return a
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class SubRow:
     id: str
     label: str
@@ -173,7 +193,7 @@ class SubRow:
     level: int
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class CompRow:
     id: str
     sum_scaled: int
@@ -183,6 +203,7 @@ class CompRow:
     level: int
 
 
+@memo.lru()
 def process(
     age: time.Delta,
     raw: dict[str, int],
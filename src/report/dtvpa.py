@@ -1,12 +1,12 @@
 import dataclasses
 import datetime
-import itertools
+import typing
 
-from src import string, table, time, ui
+from src import coverage, memo, pack, registry, string, table, time
 from src.report import dtvp
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Std:
     id: str
     age_min: int
@@ -17,7 +17,7 @@ class Std:
     percentile: int
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Sum:
     id: str
     sum: int
@@ -25,45 +25,59 @@ class Sum:
     percentile: int
 
 
-@ui.cache
-def _load() -> tuple[table.Table[Std], table.Table[Sum]]:
-    std = table.read_csv("public/dtvpa-std.csv", Std)
-    sums = table.read_csv("public/dtvpa-sum.csv", Sum)
-    return std, sums
+@registry.cached
+def _load() -> tuple[table.Dense[Std], table.Dense[Sum]]:
+    std = pack.read_csv("public/dtvpa-std.csv", Std)
+    sums = pack.read_csv("public/dtvpa-sum.csv", Sum)
+    dense_std = table.dense(
+        std,
+        key=lambda r: r.id,
+        age=lambda r: (r.age_min, r.age_max),
+        age_closed=False,
+    )
+    dense_sums = table.dense(sums, key=lambda r: r.id, raw=("sum", "sum"), unique=True)
+    return dense_std, dense_sums
 
 
-def _get_std(data: table.Table[Std], i: str, age: time.Delta, r: int) -> Std:
-    return data.filter(
-        id=i,
-        age_min=lambda v: v <= age.years,
-        age_max=lambda v: v > age.years,
-        raw_min=lambda v: v <= r,
-        raw_max=lambda v: v >= r,
-    ).item()
+def _get_std(data: table.Dense[Std], i: str, age: time.Delta, r: int) -> Std:
+    return data.get(i, r, age.years)
 
 
-def _get_sum(data: table.Table[Sum], i: str, su: int) -> Sum:
-    return data.filter(id=i, sum=su).item()
+def _get_sum(data: table.Dense[Sum], i: str, su: int) -> Sum:
+    return data.get(i, su)
 
 
-def validate():
-    std, sums = _load()
-    ids = get_tests().keys()
-    ages = range(11, 18)
-    raws = range(0, 109)
-
-    for i, a, r in itertools.product(ids, ages, raws):
-        row = _get_std(std, i, time.Delta(years=a), r)
-        assert row.standard > 0
-        assert row.percentile >= 0
-
-    for i, su in itertools.chain(
-        itertools.product(["sum3"], range(3, 61)),
-        itertools.product(["sum6"], range(6, 116)),
-    ):
-        row = _get_sum(sums, i, su)
-        assert row.index > 0
-        assert row.percentile >= 0
+def specs() -> dict[str, coverage.Spec[typing.Any]]:
+    sums = {"sum3": (3, 60), "sum6": (6, 115)}
+    return {
+        "dtvpa-std": coverage.Spec[Std](
+            "dtvpa-std",
+            rows=lambda: _load()[0].source.rows,
+            key=lambda r: r.id,
+            raw=lambda r: coverage.closed(r.raw_min, r.raw_max),
+            raw_domain=lambda _: (0, 108),
+            age=lambda r: coverage.half_open(r.age_min, r.age_max),
+            age_domain=lambda _: (11, 17),
+            keys=list(get_tests()),
+            check=lambda r: r.standard > 0 and r.percentile >= 0,
+            monotonic=["standard", "percentile"],
+        ),
+        "dtvpa-sum": coverage.Spec[Sum](
+            "dtvpa-sum",
+            rows=lambda: _load()[1].source.rows,
+            key=lambda r: r.id,
+            raw=lambda r: coverage.closed(r.sum, r.sum),
+            raw_domain=lambda i: sums[str(i)],
+            keys=list(sums),
+            check=lambda r: r.index > 0 and r.percentile >= 0,
+            exact=True,
+            monotonic=["index", "percentile"],
+        ),
+    }
+
+
+def validate(workers: int = 1):
+    coverage.validate(__name__, workers=workers)
 
 
 def get_tests() -> dict[str, str]:
@@ -77,7 +91,7 @@ def get_tests() -> dict[str, str]:
     }
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Sub:
     id: str
     label: str
@@ -88,7 +102,7 @@ class Sub:
     level: int
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Comp:
     id: str
     sum_standard: int
@@ -137,6 +151,7 @@ def report(asmt: datetime.date, sub: table.Table[Sub], comp: table.Table[Comp])
     return rep.build()
 
 
+@memo.lru()
 def process(
     age: time.Delta,
     raw: dict[str, int],
@@ -1,13 +1,12 @@
 import dataclasses
 import datetime
-import itertools
 import math
 import typing
 
-from src import string, table, time, ui
+from src import coverage, memo, pack, registry, string, table, time
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class IRow:
     id: str
     age_min: int
@@ -18,7 +17,7 @@ class IRow:
     rank: int
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class TRow:
     id: str
     raw_min: int
@@ -28,50 +27,69 @@ class TRow:
     rank: int
 
 
-@ui.cache
-def _load() -> tuple[table.Table[IRow], table.Table[TRow]]:
-    map_i = table.read_csv("public/mabc-i.csv", IRow)
-    map_t = table.read_csv("public/mabc-t.csv", TRow)
-    return map_i, map_t
+@registry.cached
+def _load() -> tuple[table.Dense[IRow], table.Table[TRow]]:
+    map_i = pack.read_csv("public/mabc-i.csv", IRow)
+    map_t = pack.read_csv("public/mabc-t.csv", TRow)
+    dense_i = table.dense(
+        map_i,
+        key=lambda r: r.id,
+        age=lambda r: (r.age_min, r.age_max),
+        age_closed=False,
+    )
+    return dense_i, map_t
 
 
-def _get_i_row(data: table.Table[IRow], i: str, age: int, r: int) -> IRow:
-    return data.filter(
-        id=i,
-        age_min=lambda v: v <= age,
-        age_max=lambda v: v > age,
-        raw_min=lambda v: v <= r,
-        raw_max=lambda v: v >= r,
-    ).item()
+def _get_i_row(data: table.Dense[IRow], i: str, age: int, r: int) -> IRow:
+    return data.get(i, r, age)
 
 
 def _get_t_row(data: table.Table[TRow], i: str, r: int) -> TRow:
     return data.filter(
         id=i,
-        raw_min=lambda v: v <= r,
-        raw_max=lambda v: v >= r,
+        raw_min=table.le(r),
+        raw_max=table.ge(r),
     ).item()
 
 
-def validate():
-    map_i, map_t = _load()
-    age_min = min(r.age_min for r in map_i.rows)
-    age_max = max(int(r.age_max) for r in map_i.rows if r.age_max != float("inf"))
-    ages = range(age_min, age_max)
-    for a in ages:
-        ids = [i for lst in get_comps(time.Delta(years=a)).values() for i in lst]
-        raws = range(0, 122)
+def _i_ages(i: typing.Hashable) -> coverage.Span:
+    ages = [a for a in range(5, 16) if i in _exes(time.Delta(years=a))]
+    return min(ages), max(ages)
+
+
+def _exes(age: time.Delta) -> list[str]:
+    return [i for lst in get_comps(age).values() for i in lst]
+
+
+def specs() -> dict[str, coverage.Spec[typing.Any]]:
+    return {
+        "mabc-i": coverage.Spec[IRow](
+            "mabc-i",
+            rows=lambda: _load()[0].source.rows,
+            key=lambda r: r.id,
+            raw=lambda r: coverage.closed(r.raw_min, r.raw_max),
+            raw_domain=lambda _: (0, 121),
+            age=lambda r: coverage.half_open(r.age_min, r.age_max),
+            age_domain=_i_ages,
+            keys=sorted({i for a in range(5, 16) for i in _exes(time.Delta(a))}),
+            check=lambda r: r.standard > 0,
+            monotonic=["standard"],
+        ),
+        "mabc-t": coverage.Spec[TRow](
+            "mabc-t",
+            rows=lambda: _load()[1].rows,
+            key=lambda r: r.id,
+            raw=lambda r: coverage.closed(r.raw_min, r.raw_max),
+            raw_domain=lambda _: (0, 108),
+            keys=["hg", "bf", "bl", "gw"],
+            check=lambda r: r.standard > 0 and r.percentile > 0,
+            monotonic=["standard", "percentile"],
+        ),
+    }
 
-        for i, r in itertools.product(ids, raws):
-            row = _get_i_row(map_i, i, a, r)
-            assert row.standard > 0
 
-    ids = ["hg", "bf", "bl", "gw"]
-    raws = range(0, 109)
-    for i, r in itertools.product(ids, raws):
-        row = _get_t_row(map_t, i, r)
-        assert row.standard > 0
-        assert row.percentile > 0
+def validate(workers: int = 1):
+    coverage.validate(__name__, workers=workers)
 
 
 def get_comps(age: time.Delta) -> dict[str, list[str]]:
@@ -97,7 +115,7 @@ def get_failed() -> list[str]:
 
 
 def _process_comp(
-    map_i: table.Table[IRow], age: int, raw: dict[str, typing.Optional[int]]
+    map_i: table.Dense[IRow], age: int, raw: dict[str, typing.Optional[int]]
 ) -> dict[str, tuple[int | None, int]]:
     comp: dict[str, tuple[int | None, int]] = {}
     for k, v in raw.items():
@@ -150,7 +168,7 @@ def level(std: int) -> typing.Literal[0, 1, 2, 3]:
     return 3
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class CompResultRow:
     id: str
     raw: int | None
@@ -158,7 +176,7 @@ class CompResultRow:
     level: int
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class AggResultRow:
     id: str
     raw: int
@@ -167,6 +185,7 @@ class AggResultRow:
     level: int
 
 
+@memo.lru()
 def process(
     age: time.Delta,
     raw: dict[str, typing.Optional[int]],
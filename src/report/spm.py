@@ -1,9 +1,9 @@
 import dataclasses
 import datetime
-import itertools
+import typing
 from typing import Literal
 
-from src import string, table, time, ui
+from src import coverage, memo, pack, registry, string, table, time
 
 Form = Literal["Classroom", "Home"]
 Version = Literal[1, 2]
@@ -15,7 +15,7 @@ def forms(ver: Version) -> list[Form]:
     return ["Home"]
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Filer:
     prep: str | None
     name: str
@@ -47,7 +47,7 @@ def get_scores() -> dict[str, str]:
     }
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Spm:
     id: str
     raw_min: int
@@ -57,42 +57,59 @@ class Spm:
     type: str
 
 
-@ui.cache
-def _load() -> table.Table[Spm]:
-    classroom = table.read_csv("public/spm-classroom.csv", Spm)
-    home = table.read_csv("public/spm-home.csv", Spm)
-    home2 = table.read_csv("public/spm2-home.csv", Spm)
-    return classroom.concat(home).concat(home2)
+@registry.cached
+def _load() -> table.Dense[Spm]:
+    classroom = pack.read_csv("public/spm-classroom.csv", Spm)
+    home = pack.read_csv("public/spm-home.csv", Spm)
+    home2 = pack.read_csv("public/spm2-home.csv", Spm)
+    return table.dense(
+        classroom.concat(home).concat(home2), key=lambda r: (r.type, r.id)
+    )
 
 
-def _get_row(data: table.Table[Spm], form: str, i: str, r: int) -> Spm:
-    return data.filter(
-        type=form,
-        id=i,
-        raw_min=lambda v: v <= r,
-        raw_max=lambda v: v >= r,
-    ).item()
+def _get_row(data: table.Dense[Spm], form: str, i: str, r: int) -> Spm:
+    return data.get((form, i), r)
 
 
-def validate(ver: Version):
-    data = _load()
-    types = ["classroom", "home"] if ver == 1 else ["home"]
+def _ids(ver: Version) -> list[str]:
     ids = list(get_scores().keys())
     if ver == 1:
         ids.remove("t&s")
-    ids.append("st")
-    raws = range(0, 171)
+    return ids + ["st"]
+
+
+def _spec(t: str, ver: Version) -> coverage.Spec[Spm]:
+    return coverage.Spec[Spm](
+        f"spm-{t}",
+        rows=lambda: [r for r in _load().source.rows if r.type == t],
+        key=lambda r: r.id,
+        raw=lambda r: coverage.closed(r.raw_min, r.raw_max),
+        raw_domain=lambda _: (0, 170),
+        keys=_ids(ver),
+        check=lambda r: r.percentile > 0 and r.t > 0,
+        monotonic=["percentile", "t"],
+    )
+
+
+def _types(ver: Version) -> list[str]:
+    return [t + str(ver) for t in (["classroom", "home"] if ver == 1 else ["home"])]
+
+
+def specs() -> dict[str, coverage.Spec[typing.Any]]:
+    return {
+        f"spm-{t}": _spec(t, v) for v in typing.get_args(Version) for t in _types(v)
+    }
 
-    for t, i, r in itertools.product(types, ids, raws):
-        row = _get_row(data, t + str(ver), i, r)
-        assert row.percentile > 0
-        assert row.t > 0
+
+def validate(ver: Version | None = None, workers: int = 1):
+    names = None if ver is None else [f"spm-{t}" for t in _types(ver)]
+    coverage.validate(__name__, names, workers)
 
 
 typical = "Typical"
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Result:
     id: str
     raw: int
@@ -200,6 +217,7 @@ def _report(
     return rep.build()
 
 
+@memo.lru()
 def process(
     asmt: datetime.date,
     form: Form,
@@ -213,9 +231,12 @@ def process(
     def ver1():
         return ver == 1
 
-    raw["st"] = sum(
-        [raw["vis"], raw["hea"], raw["tou"], raw["t&s"], raw["bod"], raw["bal"]]
-    )
+    raw = {
+        **raw,
+        "st": sum(
+            [raw["vis"], raw["hea"], raw["tou"], raw["t&s"], raw["bod"], raw["bal"]]
+        ),
+    }
 
     def inter(t: int) -> tuple[str, int]:
         if t < 60:
@@ -0,0 +1,113 @@
+import argparse
+import dataclasses
+import importlib
+import json
+import os
+import subprocess
+import sys
+import timeit
+from typing import Any, Callable, Mapping
+
+PAGES = {
+    "dtvp3": ("src.report.dtvp", "src.page.dtvp"),
+    "dtvpa": ("src.report.dtvpa", "src.page.dtvp"),
+    "mabc": ("src.report.mabc", "src.page.mabc"),
+    "spm": ("src.report.spm", "src.page.spm"),
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class Phase:
+    phase: str
+    name: str
+    seconds: float
+
+
+TIMELINE: list[Phase] = []
+
+
+def record[T](phase: str, name: str, fn: Callable[[], T]) -> T:
+    if any(p.phase == phase and p.name == name for p in TIMELINE):
+        return fn()
+    start = timeit.default_timer()
+    res = fn()
+    TIMELINE.append(Phase(phase, name, timeit.default_timer() - start))
+    return res
+
+
+def requested(query: Mapping[str, str]) -> str | None:
+    return query.get("startup") or os.environ.get("REPORTUS_STARTUP") or None
+
+
+def wrap(path: str, page: Callable[[], None]) -> Callable[[], None]:
+    report, module = PAGES[path]
+
+    def run():
+        record("import", report, lambda: importlib.import_module(report))
+        record("import", module, lambda: importlib.import_module(module))
+        record("load", report, lambda: importlib.import_module(report)._load())
+        record("render", path, page)
+
+    run.__name__ = page.__name__
+    return run
+
+
+def rows() -> list[dict[str, Any]]:
+    return [dataclasses.asdict(p) for p in TIMELINE]
+
+
+def _child(path: str) -> list[dict[str, Any]]:
+    # run as __main__, so share the timeline with the copy app.py imports
+    from src import startup
+
+    startup.record("import", "streamlit", lambda: importlib.import_module("streamlit"))
+
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file("app.py")
+    at.query_params["startup"] = path
+    startup.record("run", "app", lambda: at.run(timeout=60))
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return startup.rows()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="startup")
+    parser.add_argument("pages", nargs="*", help=f"default: {' '.join(PAGES)}")
+    parser.add_argument("--json", action="store_true")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        json.dump(_child(args.child), sys.stdout)
+        return 0
+
+    for path in args.pages:
+        if path not in PAGES:
+            parser.error(f"unknown page {path!r}")
+
+    results: dict[str, list[dict[str, Any]]] = {}
+    for path in args.pages or list(PAGES):
+        out = subprocess.run(
+            [sys.executable, "-m", "src.startup", "--child", path],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        results[path] = json.loads(out.stdout)
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return 0
+
+    for path, phases in results.items():
+        print(path)
+        for p in phases:
+            print(f"  {p['phase']:8} {p['name']:20} {p['seconds'] * 1e3:9.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,32 +1,386 @@
+import bisect
 import csv
 import dataclasses
+import functools
+import math
+import operator
 import typing
-from typing import Any, Callable, ClassVar, Protocol
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Hashable,
+    Iterable,
+    Iterator,
+    Literal,
+    Protocol,
+    Sequence,
+)
 
 
 class DataclassInstance(Protocol):
     __dataclass_fields__: ClassVar[dict[str, Any]]
 
 
+Op = Literal["<", "<=", ">", ">="]
+
+
+@dataclasses.dataclass(frozen=True)
+class Bound:
+    op: Op
+    value: Any
+
+    def __call__(self, v: Any) -> bool:
+        if self.op == "<":
+            return v < self.value
+        if self.op == "<=":
+            return v <= self.value
+        if self.op == ">":
+            return v > self.value
+        return v >= self.value
+
+
+def lt(value: Any) -> Bound:
+    return Bound("<", value)
+
+
+def le(value: Any) -> Bound:
+    return Bound("<=", value)
+
+
+def gt(value: Any) -> Bound:
+    return Bound(">", value)
+
+
+def ge(value: Any) -> Bound:
+    return Bound(">=", value)
+
+
+@dataclasses.dataclass(frozen=True)
+class _Axis:
+    lo: str
+    lo_strict: bool
+    hi: str
+    hi_strict: bool
+
+    def disjoint(self, hi: Any, next_lo: Any) -> bool:
+        if self.lo_strict or self.hi_strict:
+            return next_lo >= hi
+        return next_lo > hi
+
+
+@dataclasses.dataclass(frozen=True)
+class _Bands:
+    axis: _Axis
+    lows: list[Any]
+    highs: list[Any]
+    children: "list[_Bands] | list[list[int]]"
+    disjoint: bool
+
+    def find(self, values: list[Any], out: list[int]) -> None:
+        x = values[0]
+        if self.axis.lo_strict:
+            k = bisect.bisect_left(self.lows, x)
+        else:
+            k = bisect.bisect_right(self.lows, x)
+        for b in range(max(k - 1, 0) if self.disjoint else 0, k):
+            hi = self.highs[b]
+            if hi < x or (self.axis.hi_strict and hi == x):
+                continue
+            child = self.children[b]
+            if isinstance(child, _Bands):
+                child.find(values[1:], out)
+            else:
+                out.extend(child)
+
+
+def _build_bands(
+    cols: Callable[[str], Sequence[Any]], idx: list[int], axes: list[_Axis]
+) -> _Bands:
+    axis = axes[0]
+    lo, hi = cols(axis.lo), cols(axis.hi)
+    groups: dict[tuple[Any, Any], list[int]] = {}
+    for i in idx:
+        groups.setdefault((lo[i], hi[i]), []).append(i)
+    bands = sorted(groups)
+    lows = [b[0] for b in bands]
+    highs = [b[1] for b in bands]
+    children = (
+        [_build_bands(cols, groups[b], axes[1:]) for b in bands]
+        if len(axes) > 1
+        else [groups[b] for b in bands]
+    )
+    return _Bands(
+        axis=axis,
+        lows=lows,
+        highs=highs,
+        children=children,
+        disjoint=all(axis.disjoint(h, l) for h, l in zip(highs, lows[1:])),
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class _Index:
+    eq: tuple[str, ...]
+    axes: tuple[_Axis, ...]
+    parts: "dict[tuple[Any, ...], _Bands | list[int]]"
+
+    def find(self, eq: tuple[Any, ...], values: list[Any]) -> list[int]:
+        part = self.parts.get(eq)
+        if part is None:
+            return []
+        if isinstance(part, list):
+            return part
+        out: list[int] = []
+        part.find(values, out)
+        if len(out) > 1:
+            out.sort()
+        return out
+
+
+def _build_index(
+    rows: Sequence[Any], eq: tuple[str, ...], axes: tuple[_Axis, ...]
+) -> _Index:
+    cache: dict[str, Sequence[Any]] = {}
+
+    def cols(name: str) -> Sequence[Any]:
+        if name not in cache:
+            cache[name] = _column(rows, name)
+        return cache[name]
+
+    groups: dict[tuple[Any, ...], list[int]] = {}
+    keys = zip(*(cols(k) for k in eq)) if eq else (() for _ in rows)
+    for i, k in enumerate(keys):
+        groups.setdefault(k, []).append(i)
+    parts: dict[tuple[Any, ...], _Bands | list[int]] = {
+        k: _build_bands(cols, v, list(axes)) if axes else v for k, v in groups.items()
+    }
+    return _Index(eq=eq, axes=axes, parts=parts)
+
+
+Kind = Literal["eq", "call", "<", "<=", ">", ">="]
+Shape = tuple[tuple[str, Kind, bool], ...]
+
+_COST = {"eq": 0, "<": 1, "<=": 1, ">": 1, ">=": 1, "call": 2}
+_NONE = object()
+
+
+def _shape(items: Iterable[tuple[str, Any]]) -> Shape:
+    shape: list[tuple[str, Kind, bool]] = []
+    prev: Any = _NONE
+    for k, v in items:
+        if isinstance(v, Bound):
+            shape.append((k, v.op, prev is not _NONE and prev == v.value))
+            prev = v.value
+        else:
+            shape.append((k, "call" if callable(v) else "eq", False))
+            prev = _NONE
+    return tuple(shape)
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class _Plan:
+    names: tuple[str, ...]
+    eq: tuple[int, ...]
+    axes: tuple[tuple[_Axis, int], ...]
+    rest: tuple[int, ...]
+    scan: tuple[int, ...]
+    eq_names: tuple[str, ...]
+    index_axes: tuple[_Axis, ...]
+
+    def preds(self, order: tuple[int, ...], values: list[Any]) -> dict[str, Any]:
+        return {self.names[i]: values[i] for i in order}
+
+
+def _lower(kind: Kind) -> bool:
+    return kind in ("<", "<=")
+
+
+def _build_plan(shape: Shape) -> _Plan:
+    eq: list[int] = []
+    axes: list[tuple[_Axis, int]] = []
+    rest: list[int] = []
+    i = 0
+    while i < len(shape):
+        k, kind, _ = shape[i]
+        if kind == "eq":
+            eq.append(i)
+        elif kind != "call" and i + 1 < len(shape) and shape[i + 1][2]:
+            k1, kind1, _ = shape[i + 1]
+            if _lower(kind) != _lower(kind1):
+                lo, hi = (
+                    ((k, kind), (k1, kind1))
+                    if _lower(kind)
+                    else ((k1, kind1), (k, kind))
+                )
+                axes.append((_Axis(lo[0], lo[1] == "<", hi[0], hi[1] == ">"), i))
+                i += 2
+                continue
+            rest.append(i)
+        else:
+            rest.append(i)
+        i += 1
+
+    def cost(j: int) -> int:
+        return _COST[shape[j][1]]
+
+    names = tuple(k for k, _, _ in shape)
+    return _Plan(
+        names=names,
+        eq=tuple(eq),
+        axes=tuple(axes),
+        rest=tuple(sorted(rest, key=cost)),
+        scan=tuple(sorted(range(len(shape)), key=cost)),
+        eq_names=tuple(names[i] for i in eq),
+        index_axes=tuple(a for a, _ in axes),
+    )
+
+
+_PLANS: dict[Shape, _Plan] = {}
+
+
+def _plan(shape: Shape) -> _Plan:
+    plan = _PLANS.get(shape)
+    if plan is None:
+        plan = _PLANS[shape] = _build_plan(shape)
+    return plan
+
+
+class Columns[T: DataclassInstance](Sequence[T]):
+    def __init__(
+        self,
+        cls: type[T],
+        columns: dict[str, Sequence[Any]],
+        selection: Sequence[int] | None = None,
+    ):
+        self.cls = cls
+        self.columns = columns
+        self.names = [f.name for f in dataclasses.fields(cls)]
+        if selection is None:
+            selection = range(len(columns[self.names[0]]) if self.names else 0)
+        self.selection = selection
+
+    @typing.override
+    def __len__(self) -> int:
+        return len(self.selection)
+
+    @typing.overload
+    def __getitem__(self, i: int) -> T: ...
+
+    @typing.overload
+    def __getitem__(self, i: slice) -> "Columns[T]": ...
+
+    @typing.override
+    def __getitem__(self, i: int | slice) -> "T | Columns[T]":
+        if isinstance(i, slice):
+            return Columns(self.cls, self.columns, self.selection[i])
+        j = self.selection[i]
+        return self.cls(*(self.columns[n][j] for n in self.names))
+
+    @typing.override
+    def __iter__(self) -> Iterator[T]:
+        cols = [self.columns[n] for n in self.names]
+        for j in self.selection:
+            yield self.cls(*(c[j] for c in cols))
+
+    @typing.override
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Sequence) and list(self) == list(other)
+
+    def column(self, name: str) -> list[Any]:
+        col = self.columns[name]
+        return [col[j] for j in self.selection]
+
+    def select(self, idx: Iterable[int]) -> "Columns[T]":
+        return Columns(self.cls, self.columns, [self.selection[i] for i in idx])
+
+    def concat(self, other: "Columns[T]") -> "Columns[T]":
+        if other.columns is self.columns:
+            return Columns(self.cls, self.columns, [*self.selection, *other.selection])
+        columns: dict[str, Sequence[Any]] = {
+            n: self.column(n) + other.column(n) for n in self.names
+        }
+        return Columns(self.cls, columns)
+
+
+def _column(rows: Sequence[Any], name: str) -> Sequence[Any]:
+    if isinstance(rows, Columns):
+        return rows.column(name)
+    return [getattr(r, name) for r in rows]
+
+
+INDEX_MIN_ROWS = 32
+
+
 @dataclasses.dataclass(frozen=True)
 class Table[T: DataclassInstance]:
-    rows: list[T]
+    rows: Sequence[T]
+    _indexes: dict[Any, _Index] = dataclasses.field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _columns: dict[str, list[Any]] = dataclasses.field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _derived: dict[str, Any] = dataclasses.field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def concat(self, other: "Table[T]") -> "Table[T]":
-        return Table(self.rows + other.rows)
+        if isinstance(self.rows, Columns) and isinstance(other.rows, Columns):
+            return Table(self.rows.concat(other.rows))
+        return Table([*self.rows, *other.rows])
 
     def filter(self, **kwargs: Any) -> "Table[T]":
-        def match(row: T) -> bool:
-            for k, v in kwargs.items():
-                val = getattr(row, k)
+        plan = _plan(_shape(kwargs.items()))
+        values = list(kwargs.values())
+
+        if len(self.rows) >= INDEX_MIN_ROWS and (plan.eq or plan.axes):
+            index = self._indexes.get(plan)
+            if index is None:
+                index = self._index(plan.eq_names, plan.index_axes)
+                self._indexes[plan] = index
+            found = self._select(
+                index.find(
+                    tuple([values[i] for i in plan.eq]),
+                    [values[i].value for _, i in plan.axes],
+                )
+            )
+            return found._scan(plan.preds(plan.rest, values)) if plan.rest else found
+
+        return self._scan(plan.preds(plan.scan, values))
+
+    def _scan(self, preds: dict[str, Any]) -> "Table[T]":
+        if isinstance(self.rows, Columns):
+            found: Sequence[int] = range(len(self.rows))
+            for k, v in preds.items():
+                col = self.rows.column(k)
                 if callable(v):
-                    if not v(val):
-                        return False
-                elif val != v:
-                    return False
-            return True
+                    found = [i for i in found if v(col[i])]
+                else:
+                    found = [i for i in found if col[i] == v]
+            return self._select(found)
+
+        rows: Sequence[T] = self.rows
+        for k, v in preds.items():
+            get = operator.attrgetter(k)
+            if callable(v):
+                rows = [r for r in rows if v(get(r))]
+            else:
+                rows = [r for r in rows if get(r) == v]
+        return Table(list(rows))
 
-        return Table([r for r in self.rows if match(r)])
+    def _select(self, idx: Sequence[int]) -> "Table[T]":
+        if isinstance(self.rows, Columns):
+            return Table(self.rows.select(idx))
+        return Table([self.rows[i] for i in idx])
+
+    def _index(self, eq: tuple[str, ...], axes: tuple[_Axis, ...]) -> _Index:
+        key = (eq, axes)
+        index = self._indexes.get(key)
+        if index is None:
+            index = _build_index(self.rows, eq, axes)
+            self._indexes[key] = index
+        return index
 
     def is_empty(self) -> bool:
         return len(self.rows) == 0
@@ -38,27 +392,172 @@ class Table[T: DataclassInstance]:
         return Table([func(r) for r in self.rows])
 
     def sort(self, key: Callable[[T], str | int]) -> "Table[T]":
+        if isinstance(self.rows, Columns):
+            rows = self.rows
+            return self._select(sorted(range(len(rows)), key=lambda i: key(rows[i])))
         return Table(sorted(self.rows, key=key))
 
+    def to_columns(self) -> dict[str, list[Any]]:
+        if not self._columns and len(self.rows):
+            if isinstance(self.rows, Columns):
+                names = self.rows.names
+                self._columns.update({n: self.rows.column(n) for n in names})
+            else:
+                names = [f.name for f in dataclasses.fields(self.rows[0])]
+                self._columns.update(
+                    {n: list(map(operator.attrgetter(n), self.rows)) for n in names}
+                )
+        return self._columns
+
+    def derived[V](self, name: str, build: Callable[["Table[T]"], V]) -> V:
+        if name not in self._derived:
+            self._derived[name] = build(self)
+        return self._derived[name]
+
     def to_dicts(self) -> list[dict[str, Any]]:
-        fields = dataclasses.fields(self.rows[0])
-        return [{f.name: getattr(r, f.name) for f in fields} for r in self.rows]
+        cols = self.to_columns()
+        return [dict(zip(cols, vals)) for vals in zip(*cols.values())]
 
 
-def read_csv[T: DataclassInstance](path: str, cls: type[T]) -> Table[T]:
-    fields = dataclasses.fields(cls)
-    type_hints = typing.get_type_hints(cls)
-    with open(path) as f:
-        reader = csv.DictReader(f)
-        rows: list[T] = []
+class DomainError(LookupError):
+    pass
+
+
+class AmbiguityError(ValueError):
+    pass
+
+
+@dataclasses.dataclass(frozen=True)
+class Dense[T: DataclassInstance]:
+    source: Table[T]
+    slots: dict[Hashable, list[list[T | None] | None]]
+    raw_name: str = "raw"
+
+    def get(self, key: Hashable, raw: int, age: int | None = None) -> T:
+        ages = self.slots.get(key)
+        a = 0 if age is None else age
+        if ages is not None and a >= 0 and raw >= 0:
+            raws = ages[min(a, len(ages) - 1)]
+            if raws is not None:
+                row = raws[min(raw, len(raws) - 1)]
+                if row is not None:
+                    return row
+        where = f"{self.raw_name} {raw}"
+        if age is not None:
+            where = f"age {age} and {where}"
+        raise DomainError(f"no row for {key!r} at {where}")
+
+
+def _size(bounds: list[float]) -> int:
+    return int(max((b for b in bounds if b != math.inf), default=0)) + 2
+
+
+def _span(lo: float, hi: float, size: int, closed: bool) -> range:
+    end = size if hi == math.inf else int(hi) + (1 if closed else 0)
+    return range(int(lo), min(end, size))
+
+
+def dense[T: DataclassInstance](
+    t: Table[T],
+    key: Callable[[T], Hashable],
+    age: Callable[[T], tuple[float, float]] = lambda _: (0, math.inf),
+    age_closed: bool = True,
+    raw: tuple[str, str] = ("raw_min", "raw_max"),
+    unique: bool = False,
+) -> Dense[T]:
+    groups: dict[Hashable, dict[tuple[float, float], list[T]]] = {}
+    for r in t.rows:
+        groups.setdefault(key(r), {}).setdefault(age(r), []).append(r)
+
+    name = raw[0].removesuffix("_min")
+    slots: dict[Hashable, list[list[T | None] | None]] = {}
+    for k, bands in groups.items():
+        ages: list[list[T | None] | None] = [None] * _size(
+            [b for band in bands for b in band]
+        )
+        for (lo, hi), rows in bands.items():
+            raws: list[T | None] = [None] * _size(
+                [getattr(r, f) for r in rows for f in raw]
+            )
+            for r in rows:
+                for i in _span(getattr(r, raw[0]), getattr(r, raw[1]), len(raws), True):
+                    if raws[i] is None:
+                        raws[i] = r
+                    elif unique:
+                        raise AmbiguityError(
+                            f"rows for {k!r} at age {lo}..{hi} overlap at {name} {i}"
+                        )
+            for a in _span(lo, hi, len(ages), age_closed):
+                if ages[a] is None:
+                    ages[a] = raws
+                elif unique:
+                    raise AmbiguityError(f"age bands for {k!r} overlap at age {a}")
+        slots[k] = ages
+
+    return Dense(source=t, slots=slots, raw_name=name)
+
+
+@dataclasses.dataclass(frozen=True)
+class Schema[T: DataclassInstance]:
+    cls: type[T]
+    names: tuple[str, ...]
+    columns: tuple[int | None, ...]
+    converters: tuple[Callable[[str], Any], ...]
+
+    def row(self, raw: Sequence[str]) -> T:
+        if None in self.columns:
+            return self.cls(
+                **{
+                    n: c(raw[i])
+                    for n, i, c in zip(self.names, self.columns, self.converters)
+                    if i is not None
+                }
+            )
+        return self.cls(
+            *[c(raw[i]) for i, c in zip(self.columns, self.converters) if i is not None]
+        )
+
+    def rows(self, raws: list[list[str]]) -> list[T]:
+        if not raws or None in self.columns:
+            return [self.row(r) for r in raws]
+        cols = list(zip(*raws))
+        values = [
+            map(c, cols[i])
+            for i, c in zip(self.columns, self.converters)
+            if i is not None
+        ]
+        return list(map(self.cls, *values))
+
+
+@functools.cache
+def compile_schema[T: DataclassInstance](
+    cls: type[T], header: tuple[str, ...]
+) -> Schema[T]:
+    hints = typing.get_type_hints(cls)
+    names = tuple(f.name for f in dataclasses.fields(cls))
+    pos = {h: i for i, h in enumerate(header)}
+    return Schema(
+        cls=cls,
+        names=names,
+        columns=tuple(pos.get(n) for n in names),
+        converters=tuple(hints[n] for n in names),
+    )
+
+
+def iter_csv[T: DataclassInstance](path: str, cls: type[T]) -> Iterator[T]:
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        schema = compile_schema(cls, tuple(next(reader, ())))
         for raw in reader:
-            values = {}
-            for field in fields:
-                if field.name in raw:
-                    values[field.name] = type_hints[field.name](raw[field.name])
-            rows.append(cls(**values))
+            if raw:
+                yield schema.row(raw)
 
-    return Table(rows)
+
+def read_csv[T: DataclassInstance](path: str, cls: type[T]) -> Table[T]:
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        schema = compile_schema(cls, tuple(next(reader, ())))
+        return Table(schema.rows([raw for raw in reader if raw]))
 
 
 def from_list[T: DataclassInstance](rows: list[T]) -> Table[T]:
@@ -1,12 +1,19 @@
 import calendar
 from dataclasses import dataclass
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 
 
 def format_date(dat: date, day: bool = True) -> str:
     return dat.strftime("%d.%m.%Y" if day else "%m.%Y")
 
 
+def parse_date(s: str) -> date:
+    s = s.strip()
+    if "." in s:
+        return datetime.strptime(s, "%d.%m.%Y").date()
+    return date.fromisoformat(s)
+
+
 @dataclass(frozen=True)
 class Delta:
     years: int
@@ -0,0 +1,136 @@
+import contextlib
+import contextvars
+import dataclasses
+import functools
+import importlib
+import threading
+import timeit
+from typing import Any, Callable, Generator
+
+from src import pack, table
+
+SPANS = {
+    "src.report.dtvp": ["process", "_load", "report"],
+    "src.report.dtvpa": ["process", "_load", "report"],
+    "src.report.mabc": ["process", "_load", "_process_comp", "_process_agg", "report"],
+    "src.report.spm": ["process", "_load", "_report"],
+}
+
+COUNTERS = {
+    "src.report.dtvp": ["_get_ra", "_get_rs", "_get_sp"],
+    "src.report.dtvpa": ["_get_std", "_get_sum"],
+    "src.report.mabc": ["_get_i_row", "_get_t_row"],
+    "src.report.spm": ["_get_row"],
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class Span:
+    name: str
+    start: float
+    seconds: float
+    depth: int
+
+
+@dataclasses.dataclass
+class Counter:
+    calls: int = 0
+    seconds: float = 0.0
+
+
+@dataclasses.dataclass
+class Trace:
+    start: float = dataclasses.field(default_factory=timeit.default_timer)
+    spans: list[Span] = dataclasses.field(default_factory=list[Span])
+    counters: dict[str, Counter] = dataclasses.field(default_factory=dict[str, Counter])
+    depth: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "seconds": timeit.default_timer() - self.start,
+            "spans": [
+                dataclasses.asdict(s) for s in sorted(self.spans, key=lambda s: s.start)
+            ],
+            "counters": {k: dataclasses.asdict(c) for k, c in self.counters.items()},
+        }
+
+
+_current: contextvars.ContextVar[Trace | None] = contextvars.ContextVar(
+    "trace", default=None
+)
+_patched: list[tuple[object, str, Any]] = []
+_lock = threading.Lock()
+
+
+def _wrap(name: str, fn: Callable[..., Any], span: bool) -> Callable[..., Any]:
+    @functools.wraps(fn, updated=())
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        t = _current.get()
+        if t is None:
+            return fn(*args, **kwargs)
+        start = timeit.default_timer()
+        t.depth += span
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            seconds = timeit.default_timer() - start
+            if span:
+                t.depth -= 1
+                t.spans.append(Span(name, start - t.start, seconds, t.depth))
+            else:
+                c = t.counters.setdefault(name, Counter())
+                c.calls += 1
+                c.seconds += seconds
+
+    return wrapper
+
+
+def _patch(owner: object, attr: str, name: str, span: bool) -> None:
+    fn = getattr(owner, attr)
+    _patched.append((owner, attr, fn))
+    setattr(owner, attr, _wrap(name, fn, span))
+
+
+def enabled() -> bool:
+    return bool(_patched)
+
+
+def current() -> Trace | None:
+    return _current.get()
+
+
+def enable() -> None:
+    with _lock:
+        if not enabled():
+            _enable()
+
+
+def _enable() -> None:
+    for cls in [table.Table, table.Dense]:
+        for attr in ["filter", "item", "map", "sort", "to_dicts", "get"]:
+            if attr in vars(cls):
+                _patch(cls, attr, f"{cls.__name__}.{attr}", False)
+    _patch(table, "read_csv", "table.read_csv", False)
+    _patch(pack, "read_csv", "pack.read_csv", False)
+    for names, span in [(SPANS, True), (COUNTERS, False)]:
+        for mod, attrs in names.items():
+            m = importlib.import_module(mod)
+            for attr in attrs:
+                _patch(m, attr, f"{mod.rsplit('.', 1)[-1]}.{attr}", span)
+
+
+def disable() -> None:
+    with _lock:
+        while _patched:
+            owner, attr, fn = _patched.pop()
+            setattr(owner, attr, fn)
+
+
+@contextlib.contextmanager
+def session() -> Generator[Trace]:
+    t = Trace()
+    token = _current.set(t)
+    try:
+        yield t
+    finally:
+        _current.reset(token)
@@ -1,8 +1,11 @@
 import datetime
+import functools
 from typing import Any, Callable, Literal
 
+import pyarrow as pa
 import streamlit as st
 
+from src import trace
 from src.table import Table
 from src.time import Delta, minus_delta, to_delta
 
@@ -28,8 +31,44 @@ def structure(title: str):
     return hori, vert
 
 
+def fragment[**P](fn: Callable[P, None]) -> Callable[P, None]:
+    @functools.wraps(fn)
+    def run(*args: P.args, **kwargs: P.kwargs) -> None:
+        # a fragment-only rerun skips the session app.py opens
+        if not trace.enabled() or trace.current() is not None:
+            return fn(*args, **kwargs)
+        with trace.session() as t:
+            fn(*args, **kwargs)
+        with st.expander("Trace"):
+            st.json(t.to_dict(), expanded=False)
+
+    return st.fragment(run)
+
+
+KEPT = "kept:"
+
+
+def kept[**P, T](widget: Callable[P, T]) -> Callable[P, T]:
+    # streamlit drops widget state when its page is left; keep a copy to restore
+    def run(*args: P.args, **kwargs: P.kwargs) -> T:
+        key = str(kwargs["key"])
+        if key not in st.session_state and KEPT + key in st.session_state:
+            st.session_state[key] = st.session_state[KEPT + key]
+            if "value" in kwargs:
+                kwargs["value"] = None
+        value = widget(*args, **kwargs)
+        st.session_state[KEPT + key] = value
+        return value
+
+    return run
+
+
 def date_input(label: str, date: datetime.date, key: str | None = None, **kwargs: Any):
-    return st.date_input(label, date, format="DD.MM.YYYY", key=key, **kwargs)
+    if key is None:
+        return st.date_input(label, date, format="DD.MM.YYYY", **kwargs)
+    return kept(st.date_input)(
+        label, value=date, format="DD.MM.YYYY", key=key, **kwargs
+    )
 
 
 Color = Literal["blue", "green", "red"]
@@ -64,17 +103,21 @@ def dates(
     return asmt, birth, age
 
 
+def _arrow(table: Table[Any]) -> pa.Table:
+    return pa.table(table.to_columns())
+
+
 def table(table: Table[Any], hide_cols: list[str] | None = None):
     if hide_cols is None:
         hide_cols = []
 
-    dicts = table.to_dicts()
+    data = table.derived("arrow", _arrow)
 
     def map_level(l: str) -> str:
         return {"0": "↑", "1": "→"}.get(l, "↓")
 
     st.dataframe(
-        dicts,
+        data,
         column_config={
             "level": st.column_config.MultiselectColumn(
                 "",
@@ -100,6 +143,3 @@ def table(table: Table[Any], hide_cols: list[str] | None = None):
 
 def text(txt: str):
     st.code(txt, language=None, wrap_lines=True, width="content")
-
-
-cache = st.cache_data
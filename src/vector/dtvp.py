@@ -0,0 +1,101 @@
+import dataclasses
+
+import numpy as np
+import numpy.typing as npt
+
+from src import registry, table
+from src.report import dtvp
+from src.vector import grid
+
+Strs = npt.NDArray[np.str_]
+
+SCA_BOUNDS = [4, 6, 8, 13, 15, 17]
+IDX_BOUNDS = [70, 80, 90, 111, 121, 131]
+LEVELS = np.array([2, 2, 2, 1, 0, 0, 0])
+LABELS = np.array(
+    [
+        dtvp.VERY_POOR,
+        dtvp.POOR,
+        dtvp.BELOW_AVERAGE,
+        dtvp.AVERAGE,
+        dtvp.ABOVE_AVERAGE,
+        dtvp.SUPERIOR,
+        dtvp.VERY_SUPERIOR,
+    ]
+)
+
+
+def _lvl(v: grid.Ints, bounds: list[int]) -> tuple[Strs, grid.Ints]:
+    cat = np.searchsorted(bounds, v, side="right")
+    return LABELS[cat], LEVELS[cat]
+
+
+def lvl_sca(s: grid.Ints) -> tuple[Strs, grid.Ints]:
+    return _lvl(s, SCA_BOUNDS)
+
+
+def lvl_idx(i: grid.Ints) -> tuple[Strs, grid.Ints]:
+    return _lvl(i, IDX_BOUNDS)
+
+
+@registry.cached
+def _load() -> tuple[grid.Grid, grid.Grid, grid.Grid]:
+    ra, rs, sp = dtvp._load()
+    dense_ra = table.dense(ra, key=lambda r: r.id)
+    return (
+        grid.from_dense(dense_ra, ["age_eq_y", "age_eq_m"]),
+        grid.from_dense(rs, ["scaled", "percentile"]),
+        grid.from_dense(sp, ["percentile", "index"]),
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class Sub:
+    raw: grid.Ints
+    age_eq_y: grid.Ints
+    age_eq_m: grid.Ints
+    scaled: grid.Ints
+    percentile: grid.Ints
+    descriptive: Strs
+    level: grid.Ints
+
+
+@dataclasses.dataclass(frozen=True)
+class Comp:
+    sum_scaled: grid.Ints
+    index: grid.Ints
+    percentile: grid.Ints
+    descriptive: Strs
+    level: grid.Ints
+
+
+def process(months: grid.Ints, raw: grid.Ints) -> tuple[Sub, Comp]:
+    ra, rs, sp = _load()
+    months = np.asarray(months, dtype=np.int64)
+    raw = np.asarray(raw, dtype=np.int64)
+    zeros = np.zeros(len(months), dtype=np.int64)
+
+    ids = list(dtvp.get_tests())
+    ra_rows = np.stack([ra.rows(k, zeros, raw[:, j]) for j, k in enumerate(ids)], 1)
+    rs_rows = np.stack([rs.rows(k, months, raw[:, j]) for j, k in enumerate(ids)], 1)
+    scaled = rs.columns["scaled"][rs_rows]
+    sub = Sub(
+        raw,
+        ra.columns["age_eq_y"][ra_rows],
+        ra.columns["age_eq_m"][ra_rows],
+        scaled,
+        rs.columns["percentile"][rs_rows],
+        *lvl_sca(scaled),
+    )
+
+    sums = np.stack(
+        [scaled[:, 0:2].sum(1), scaled[:, 2:5].sum(1), scaled.sum(1)], axis=1
+    )
+    sp_rows = np.stack(
+        [sp.rows(k, zeros, sums[:, j]) for j, k in enumerate(["vmi", "mrvp", "gvp"])],
+        1,
+    )
+    index = sp.columns["index"][sp_rows]
+    comp = Comp(sums, index, sp.columns["percentile"][sp_rows], *lvl_idx(index))
+
+    return sub, comp
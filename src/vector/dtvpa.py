@@ -0,0 +1,61 @@
+import dataclasses
+
+import numpy as np
+
+from src import registry
+from src.report import dtvpa
+from src.vector import dtvp, grid
+
+
+@registry.cached
+def _load() -> tuple[grid.Grid, grid.Grid]:
+    std, sums = dtvpa._load()
+    return (
+        grid.from_dense(std, ["standard", "percentile"]),
+        grid.from_dense(sums, ["index", "percentile"]),
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class Sub:
+    raw: grid.Ints
+    standard: grid.Ints
+    percentile: grid.Ints
+    description: dtvp.Strs
+    level: grid.Ints
+
+
+@dataclasses.dataclass(frozen=True)
+class Comp:
+    sum_standard: grid.Ints
+    index: grid.Ints
+    percentile: grid.Ints
+    description: dtvp.Strs
+    level: grid.Ints
+
+
+def process(months: grid.Ints, raw: grid.Ints) -> tuple[Sub, Comp]:
+    std, sums = _load()
+    years = np.asarray(months, dtype=np.int64) // 12
+    raw = np.asarray(raw, dtype=np.int64)
+    zeros = np.zeros(len(years), dtype=np.int64)
+
+    ids = list(dtvpa.get_tests())
+    rows = np.stack([std.rows(k, years, raw[:, j]) for j, k in enumerate(ids)], 1)
+    standard = std.columns["standard"][rows]
+    sub = Sub(raw, standard, std.columns["percentile"][rows], *dtvp.lvl_sca(standard))
+
+    def total(*ks: str) -> grid.Ints:
+        return standard[:, [ids.index(k) for k in ks]].sum(1)
+
+    su = np.stack(
+        [standard.sum(1), total("fg", "vc", "fc"), total("co", "vse", "vsp")], 1
+    )
+    sum_rows = np.stack(
+        [sums.rows(k, zeros, su[:, j]) for j, k in enumerate(["sum6", "sum3", "sum3"])],
+        1,
+    )
+    index = sums.columns["index"][sum_rows]
+    comp = Comp(su, index, sums.columns["percentile"][sum_rows], *dtvp.lvl_idx(index))
+
+    return sub, comp
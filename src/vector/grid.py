@@ -0,0 +1,61 @@
+import dataclasses
+from typing import Any, Hashable
+
+import numpy as np
+import numpy.typing as npt
+
+from src import table
+
+Ints = npt.NDArray[np.int64]
+
+
+@dataclasses.dataclass(frozen=True)
+class Grid:
+    index: dict[Hashable, Ints]
+    columns: dict[str, npt.NDArray[Any]]
+
+    def rows(self, key: Hashable, ages: Ints, raws: Ints) -> Ints:
+        grid = self.index.get(key)
+        if grid is None:
+            raise table.DomainError(f"no rows for {key!r}")
+        a = np.clip(ages, 0, grid.shape[0] - 1)
+        r = np.clip(raws, 0, grid.shape[1] - 1)
+        rows = grid[a, r]
+        bad = np.flatnonzero((rows < 0) | (ages < 0) | (raws < 0))
+        if len(bad) > 0:
+            i = bad[0]
+            raise table.DomainError(
+                f"no row for {key!r} at age {ages[i]} and raw {raws[i]}"
+                f" ({len(bad)} entries out of range)"
+            )
+        return rows
+
+    def get(
+        self, field: str, key: Hashable, ages: Ints, raws: Ints
+    ) -> npt.NDArray[Any]:
+        return self.columns[field][self.rows(key, ages, raws)]
+
+
+def from_dense(d: table.Dense[Any], fields: list[str]) -> Grid:
+    rows: list[Any] = []
+    pos: dict[int, int] = {}
+    index: dict[Hashable, Ints] = {}
+
+    for key, ages in d.slots.items():
+        width = max((len(raws) for raws in ages if raws is not None), default=0)
+        grid = np.full((len(ages), width), -1, dtype=np.int64)
+        for a, raws in enumerate(ages):
+            if raws is None:
+                continue
+            for r, row in enumerate(raws):
+                if row is None:
+                    continue
+                i = pos.setdefault(id(row), len(rows))
+                if i == len(rows):
+                    rows.append(row)
+                grid[a, r] = i
+            grid[a, len(raws) :] = grid[a, len(raws) - 1]
+        index[key] = grid
+
+    columns = {f: np.array([getattr(r, f) for r in rows]) for f in fields}
+    return Grid(index=index, columns=columns)
@@ -0,0 +1,93 @@
+import dataclasses
+from typing import Mapping
+
+import numpy as np
+import numpy.typing as npt
+
+from src import registry, table
+from src.report import mabc
+from src.time import Delta
+from src.vector import grid
+
+Floats = npt.NDArray[np.float64]
+
+
+@registry.cached
+def _load() -> tuple[grid.Grid, grid.Grid]:
+    dense_i, map_t = mabc._load()
+    map_i = grid.from_dense(dense_i, ["standard"])
+    dense_t = table.dense(map_t, key=lambda r: r.id)
+    return map_i, grid.from_dense(dense_t, ["standard", "percentile"])
+
+
+def _avg(v0: grid.Ints, v1: grid.Ints) -> grid.Ints:
+    s = v0 + v1
+    return np.where(s < 20, s // 2, -(-s // 2))
+
+
+def level(std: grid.Ints) -> grid.Ints:
+    return np.select([std > 7, std == 7, std == 6], [0, 1, 2], 3)
+
+
+@dataclasses.dataclass(frozen=True)
+class Result:
+    comp: dict[str, grid.Ints]
+    raw: dict[str, grid.Ints]
+    standard: dict[str, grid.Ints]
+    percentile: dict[str, Floats]
+
+
+def _process_comp(
+    map_i: grid.Grid, ages: grid.Ints, raw: Mapping[str, Floats]
+) -> dict[str, grid.Ints]:
+    n = len(ages)
+    comp: dict[str, grid.Ints] = {}
+
+    for lo, hi in [(0, 7), (7, 11), (11, None)]:
+        mask = (ages >= lo) if hi is None else (ages >= lo) & (ages < hi)
+        if not mask.any():
+            continue
+        a = ages[mask]
+        for exes in mabc.get_comps(Delta(years=lo)).values():
+            for k in exes:
+                v = np.asarray(raw[k], dtype=np.float64)[mask]
+                done = ~np.isnan(v)
+                std = np.ones(len(a), dtype=np.int64)
+                std[done] = map_i.get("standard", k, a[done], v[done].astype(np.int64))
+                comp.setdefault(k, np.zeros(n, dtype=np.int64))[mask] = std
+
+    none = np.zeros(n, dtype=np.int64)
+
+    def get(k: str) -> grid.Ints:
+        return comp.get(k, none)
+
+    comp["hg1"] = _avg(get("hg11"), get("hg12"))
+    comp["bf1"] = np.where(ages > 10, _avg(get("bf11"), get("bf12")), get("bf1"))
+    comp["bl1"] = np.where(ages < 11, _avg(get("bl11"), get("bl12")), get("bl1"))
+    comp["bl3"] = np.where(ages > 6, _avg(get("bl31"), get("bl32")), get("bl3"))
+
+    return comp
+
+
+def process(ages: grid.Ints, raw: Mapping[str, Floats]) -> Result:
+    map_i, map_t = _load()
+    ages = np.asarray(ages, dtype=np.int64)
+
+    comp = _process_comp(map_i, ages, raw)
+
+    scores = {
+        "hg": comp["hg1"] + comp["hg2"] + comp["hg3"],
+        "bf": comp["bf1"] + comp["bf2"],
+        "bl": comp["bl1"] + comp["bl2"] + comp["bl3"],
+    }
+    scores["total"] = scores["hg"] + scores["bf"] + scores["bl"]
+
+    zeros = np.zeros(len(ages), dtype=np.int64)
+    standard: dict[str, grid.Ints] = {}
+    percentile: dict[str, Floats] = {}
+    for k, s in scores.items():
+        rows = map_t.rows("gw" if k == "total" else k, zeros, s)
+        standard[k] = map_t.columns["standard"][rows]
+        percentile[k] = map_t.columns["percentile"][rows]
+
+    return Result(comp=comp, raw=scores, standard=standard, percentile=percentile)
@@ -0,0 +1,105 @@
+import dataclasses
+from typing import Iterable
+
+import numpy as np
+import numpy.typing as npt
+
+from src.vector import grid
+
+Dates = npt.NDArray[np.datetime64]
+
+FORMAT = "dates must be DD.MM.YYYY or YYYY-MM-DD"
+
+
+@dataclasses.dataclass(frozen=True)
+class Deltas:
+    years: grid.Ints
+    months: grid.Ints
+    days: grid.Ints
+
+    @property
+    def total_months(self) -> grid.Ints:
+        return self.years * 12 + self.months
+
+
+def _month_index(year: grid.Ints, month: grid.Ints) -> npt.NDArray[np.datetime64]:
+    return ((year - 1970) * 12 + month - 1).astype("datetime64[M]")
+
+
+def _days_in_month(year: grid.Ints, month: grid.Ints) -> grid.Ints:
+    first = _month_index(year, month)
+    return (
+        (first + np.timedelta64(1, "M")).astype("datetime64[D]")
+        - first.astype("datetime64[D]")
+    ).astype(np.int64)
+
+
+def _build(year: grid.Ints, month: grid.Ints, day: grid.Ints) -> Dates:
+    return _month_index(year, month).astype("datetime64[D]") + (day - 1).astype(
+        "timedelta64[D]"
+    )
+
+
+def split(dates: Dates) -> tuple[grid.Ints, grid.Ints, grid.Ints]:
+    d = np.asarray(dates, dtype="datetime64[D]")
+    month = d.astype("datetime64[M]")
+    year = month.astype("datetime64[Y]").astype(np.int64) + 1970
+    return (
+        year,
+        month.astype(np.int64) % 12 + 1,
+        (d - month.astype("datetime64[D]")).astype(np.int64) + 1,
+    )
+
+
+def _parse_dotted(s: npt.NDArray[np.str_]) -> Dates:
+    day, _, rest = np.moveaxis(np.char.partition(s, "."), -1, 0)
+    month, _, year = np.moveaxis(np.char.partition(rest, "."), -1, 0)
+    try:
+        d, m, y = (a.astype(np.int64) for a in (day, month, year))
+    except ValueError:
+        raise ValueError(FORMAT) from None
+    bad = (m < 1) | (m > 12) | (d < 1) | (y < 1)
+    bad |= d > _days_in_month(y, np.clip(m, 1, 12))
+    if bad.any():
+        raise ValueError(f"invalid date {str(s[np.argmax(bad)])!r}")
+    return _build(y, m, d)
+
+
+def parse_dates(values: Iterable[str]) -> Dates:
+    s = np.char.strip(np.asarray(list(values), dtype=np.str_))
+    out = np.empty(s.shape, dtype="datetime64[D]")
+    dotted = np.char.find(s, ".") >= 0
+    if dotted.any():
+        out[dotted] = _parse_dotted(s[dotted])
+    try:
+        out[~dotted] = s[~dotted].astype("datetime64[D]")
+    except ValueError:
+        raise ValueError(FORMAT) from None
+    nat = np.isnat(out)
+    if nat.any():
+        raise ValueError(f"invalid date {str(s[np.argmax(nat)])!r}")
+    return out
+
+
+def to_delta(start: Dates, end: Dates) -> Deltas:
+    sy, sm, sd = split(start)
+    ey, em, ed = split(end)
+
+    borrow = ed < sd
+    year, month = np.divmod(ey * 12 + em - 1 - borrow, 12)
+    month += 1
+    day = ed + np.where(borrow, _days_in_month(year, month), 0)
+
+    wrap = month < sm
+    year -= wrap
+    month += 12 * wrap
+
+    return Deltas(year - sy, month - sm, day - sd)
+
+
+def minus_delta(start: Dates, delta: Deltas) -> Dates:
+    sy, sm, sd = split(start)
+    year, month = np.divmod(sy * 12 + sm - 1 - delta.total_months, 12)
+    month += 1
+    day = np.minimum(sd, _days_in_month(year, month))
+    return _build(year, month, day) - delta.days.astype("timedelta64[D]")
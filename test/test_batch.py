@@ -0,0 +1,121 @@
+import csv
+import io
+import json
+import pathlib
+
+import pytest
+
+from src import batch, cli
+from src.report import dtvp, mabc
+from src.time import Delta, parse_date
+
+DTVP = """child,birth,asmt,eh,co,fg,vc,fc
+a,01.01.2020,01.12.2026,108,11,52,10,32
+b,2016-05-10,2026-03-03,120,30,60,20,40
+c,01.01.2020,01.12.2026,,11,52,10,32
+"""
+
+MABC = """birth,asmt,hg11,hg12,hg2,hg3,bf1,bf2,bl11,bl12,bl2,bl3
+03.03.2020,03.03.2026,17,29,,0,4,0,9,7,20,1
+"""
+
+
+def test_score():
+    res = list(batch.score(batch.read(io.StringIO(DTVP)), "dtvp3"))
+
+    assert [r.child for r in res] == ["a", "b", "c"]
+    assert res[2].error is not None and res[2].error.startswith("ValueError")
+
+    sub, comp, rep = dtvp.process(
+        Delta(years=6, months=11),
+        {"eh": 108, "co": 11, "fg": 52, "vc": 10, "fc": 32},
+        parse_date("01.12.2026"),
+    )
+    assert res[0].tables == {"sub": sub, "comp": comp}
+    assert res[0].report == rep
+
+
+def test_score_mabc():
+    res = list(batch.score(batch.read(io.StringIO(MABC)), "mabc"))
+
+    comp, agg, rep = mabc.process(
+        Delta(years=6),
+        {
+            "hg11": 17,
+            "hg12": 29,
+            "hg2": None,
+            "hg3": 0,
+            "bf1": 4,
+            "bf2": 0,
+            "bl11": 9,
+            "bl12": 7,
+            "bl2": 20,
+            "bl3": 1,
+        },
+        parse_date("03.03.2026"),
+    )
+    assert res[0].child == "1"
+    assert res[0].tables == {"comp": comp, "agg": agg}
+    assert res[0].report == rep
+
+
+def test_write_csv():
+    out = io.StringIO()
+    errors = batch.write_csv(batch.score(batch.read(io.StringIO(DTVP)), "dtvp3"), out)
+
+    assert errors == 1
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert {
+        "child": "a",
+        "table": "sub",
+        "id": "eh",
+        "field": "scaled",
+        "value": "3",
+    } in rows
+    assert [r["table"] for r in rows if r["child"] == "c"] == ["error"]
+    assert sum(1 for r in rows if r["table"] == "report") == 2
+
+
+def test_cli(tmp_path: pathlib.Path):
+    inp = tmp_path / "in.csv"
+    out = tmp_path / "out.jsonl"
+    inp.write_text(DTVP)
+
+    code = cli.main(["score", "dtvp3", str(inp), "-o", str(out), "-f", "jsonl"])
+
+    assert code == 1
+    recs = [json.loads(l) for l in out.read_text().splitlines()]
+    assert [r["child"] for r in recs] == ["a", "b", "c"]
+    assert recs[0]["tables"]["sub"][0]["scaled"] == 3
+    assert "error" in recs[2]
+
+
+def test_cli_missing_input(tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]):
+    with pytest.raises(SystemExit) as e:
+        cli.main(["score", "dtvp3", str(tmp_path / "missing.csv")])
+    assert e.value.code == 2
+    assert "missing.csv" in capsys.readouterr().err
+
+
+def test_score_parallel():
+    rows = list(batch.read(io.StringIO(DTVP))) * 5
+
+    res = list(batch.score_parallel(rows, "dtvp3", workers=2, chunk_size=2))
+
+    assert res == list(batch.score(rows, "dtvp3"))
+    assert [r.child for r in res] == ["a", "b", "c"] * 5
+
+
+@pytest.mark.parametrize(("workers", "chunk_size"), [(2, 0), (2, -1), (-1, 2)])
+def test_score_parallel_invalid(workers: int, chunk_size: int):
+    with pytest.raises(ValueError):
+        batch.score_parallel([], "dtvp3", workers=workers, chunk_size=chunk_size)
+
+
+@pytest.mark.parametrize("args", [["--chunk-size", "0"], ["-w", "-1"]])
+def test_cli_invalid_counts(tmp_path: pathlib.Path, args: list[str]):
+    inp = tmp_path / "in.csv"
+    inp.write_text(DTVP)
+    with pytest.raises(SystemExit) as e:
+        cli.main(["score", "dtvp3", str(inp), *args])
+    assert e.value.code == 2
@@ -0,0 +1,32 @@
+import json
+import pathlib
+
+from bench import suite
+from src import pack, registry, table
+from src.report import dtvp
+
+
+def test_compare():
+    baseline = {"a": 1.0, "b": 1.0}
+    current = {"a": 1.2, "b": 1.3, "c": 9.0}
+    assert suite.compare(current, baseline, 0.25) == ["b: 1000000.0us -> 1300000.0us"]
+
+
+def test_main(tmp_path: pathlib.Path):
+    baseline = tmp_path / "baseline.json"
+    args = ["-k", "lookup:spm", "-r", "1", "-b", str(baseline)]
+    assert suite.main([*args, "--save"]) == 0
+    assert list(json.loads(baseline.read_text())["results"]) == ["lookup:spm._get_row"]
+
+    data = json.loads(baseline.read_text())
+    data["results"]["lookup:spm._get_row"] = 1e-12
+    baseline.write_text(json.dumps(data))
+    assert suite.main(args) == 1
+
+
+def test_cold():
+    dtvp._load()
+    suite._cold()
+    assert pack.open_pack.cache_info().currsize == 0
+    assert table.compile_schema.cache_info().currsize == 0
+    assert dtvp._load.name not in registry.current().loaded()
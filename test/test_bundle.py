@@ -0,0 +1,20 @@
+import pathlib
+import zipfile
+
+from src import bundle
+
+
+def test_files():
+    names = bundle.files()
+    assert names[0] == "app.py"
+    assert {"src/page/mabc.py", "src/report/spm.py", "public/norms.bin"} <= set(names)
+    assert not any(n.startswith(("src/vector/", "src/batch")) for n in names)
+
+
+def test_bundle_is_fresh(tmp_path: pathlib.Path):
+    out = tmp_path / "bundle.zip"
+    bundle.build(str(out))
+    with zipfile.ZipFile(out) as fresh, zipfile.ZipFile(bundle.BUNDLE) as committed:
+        assert fresh.namelist() == committed.namelist(), "run make bundle"
+        for name in fresh.namelist():
+            assert fresh.read(name) == committed.read(name), f"run make bundle ({name})"
@@ -0,0 +1,84 @@
+import dataclasses
+import json
+import pathlib
+
+from src import cli, coverage, integrity
+
+
+def test_sweep():
+    assert coverage.sweep([(0, 4), (5, 9)], (0, 9)) == []
+    assert coverage.sweep([(5, 9), (0, 4)], (0, 9)) == []
+    assert coverage.sweep([(0, 4), (4, 9)], (0, 9)) == [("overlap", (4, 4))]
+    assert coverage.sweep([(0, 3), (5, 9)], (0, 9)) == [("gap", (4, 4))]
+    assert coverage.sweep([(1, 4)], (0, 9)) == [("gap", (0, 0)), ("gap", (5, 9))]
+    assert coverage.sweep([(0, float("inf"))], (0, 9)) == []
+
+
+@dataclasses.dataclass(frozen=True)
+class Band:
+    id: str
+    age_min: int
+    age_max: int
+    raw_min: int
+    raw_max: int
+    value: int
+
+
+def test_check_reports_every_defect():
+    rows = [
+        Band("a", 5, 6, 0, 9, 1),
+        Band("a", 5, 6, 9, 20, 1),
+        Band("a", 6, 7, 0, 20, 0),
+        Band("a", 8, 9, 0, 15, 1),
+        Band("b", 5, 9, 0, 20, 1),
+    ]
+    spec = coverage.Spec[Band](
+        "bands",
+        rows=lambda: rows,
+        key=lambda r: r.id,
+        raw=lambda r: coverage.closed(r.raw_min, r.raw_max),
+        raw_domain=lambda _: (0, 20),
+        age=lambda r: coverage.half_open(r.age_min, r.age_max),
+        age_domain=lambda _: (5, 8),
+        keys=["a", "b", "c"],
+        check=lambda r: r.value > 0,
+    )
+    assert {str(d) for d in coverage.check(spec)} == {
+        "bands: value for a raw 0..20 at age 6..6",
+        "bands: gap for c age 5..8",
+        "bands: gap for a age 7..7",
+        "bands: overlap for a raw 9..9 at age 5..5",
+        "bands: gap for a raw 16..20 at age 8..8",
+    }
+
+
+def test_run_parallel():
+    assert coverage.run("src.report.dtvp", workers=2) == []
+    assert coverage.run("src.report.spm", ["spm-home2"]) == []
+
+
+def test_integrity_report():
+    rep = integrity.report()
+    assert rep["ok"], rep["defects"]
+    assert set(rep["tables"]) >= {"dtvp-sca-per", "dtvpa-sum", "spm-home2"}
+
+
+def test_duplicates_and_order():
+    rows = [(1, 10), (2, 20), (2, 25), (3, 15), (4, 30)]
+    spec = coverage.Spec[tuple[int, int]](
+        "sums",
+        rows=lambda: rows,
+        key=lambda _: "sum",
+        raw=lambda r: (r[0], r[0]),
+        raw_domain=lambda _: (1, 4),
+        exact=True,
+    )
+    assert [d.kind for d in coverage.check(spec)] == ["duplicate"]
+    assert coverage.flips([10, 20, 25, 15, 30]) == [3]
+    assert coverage.flips([30, 20, 25, 10]) == [2]
+
+
+def test_cli_check(tmp_path: pathlib.Path):
+    out = tmp_path / "report.json"
+    assert cli.main(["check", "-o", str(out)]) == 0
+    assert json.loads(out.read_text())["ok"]
@@ -1,5 +1,8 @@
 import datetime
 
+import pytest
+
+from src import table
 from src.report import dtvp
 from src.time import Delta
 
@@ -8,6 +11,13 @@ def test_data():
     dtvp.validate()
 
 
+@pytest.mark.parametrize("months", [0, 5, 11])
+@pytest.mark.parametrize(("raw", "scaled"), [(24, 16), (25, 17)])
+def test_vc_at_ten(months: int, raw: int, scaled: int):
+    row = dtvp._get_rs(dtvp._load()[1], "vc", Delta(10, months), raw)
+    assert row.scaled == scaled
+
+
 def test_dtvp(date: tuple[datetime.date, str]):
     age = Delta(years=6, months=11)
 
@@ -40,3 +50,12 @@ def test_dtvp(date: tuple[datetime.date, str]):
         rep
         == f"Developmental Test of Visual Perception (DTVP-3) - {date[1]}\n\nVisuomotorische Integration: PR <1 - Weit unter der Norm\nVisuelle Wahrnehmung mit reduzierter motorischer Reaktion: PR 50 - Norm\nGlobale visuelle Wahrnehmung: PR 14 - Unter der Norm\n\nSubtests:\nAugen-Hand-Koordination: 4;3 J (weit unterdurchschnittlich)\nAbzeichnen: 4;8 J (unterdurchschnittlich)\nFigur-Grund: 10;5 J (durchschnittlich)\nGesaltschliessen: 5;10 J (durchschnittlich)\nFormkonstanz: 6;3 J (durchschnittlich)"
     )
+
+
+def test_get_sp():
+    _, _, sp = dtvp._load()
+    for r in sp.source.rows:
+        assert dtvp._get_sp(sp, r.id, r.scaled) == r
+    for i, s in [("vmi", 1), ("vmi", 41), ("gvp", 99), ("gvp", -3)]:
+        with pytest.raises(table.DomainError, match=f"no row for '{i}' at scaled {s}$"):
+            dtvp._get_sp(sp, i, s)
@@ -1,5 +1,8 @@
 import datetime
 
+import pytest
+
+from src import table
 from src.report import dtvpa
 from src.time import Delta
 
@@ -27,3 +30,12 @@ def test_dtvpa(date: tuple[datetime.date, str]):
         rep
         == f"Developmental Test of Visual Perception - Adolescent and Adult (DTVP-A) - ({date[1]})\n\nVisuomotorische Integration: PR 8 - Weit unter der Norm\nMotorik-Reduzierte Wahrnehmung: PR 10 - Unter der Norm\nGlobale Visuelle Wahrnehmung: PR 7 - Weit unter der Norm\n\nSubtests:\nAbzeichnen: PR 25 - durchschnittlich\nFigur-Grund: PR 9 - unterdurchschnittlich\nVisuomotorisches Suchen: PR 9 - unterdurchschnittlich\nGesaltschliessen: PR 25 - durchschnittlich\nVisuomotorische Geschwindigkeit: PR 9 - unterdurchschnittlich\nFormkonstanz: PR 16 - unterdurchschnittlich"
     )
+
+
+def test_get_sum():
+    _, sums = dtvpa._load()
+    for r in sums.source.rows:
+        assert dtvpa._get_sum(sums, r.id, r.sum) == r
+    for i, su in [("sum6", 5), ("sum6", 116), ("sum3", -1), ("sum9", 10)]:
+        with pytest.raises(table.DomainError, match=f"no row for '{i}' at sum {su}$"):
+            dtvpa._get_sum(sums, i, su)
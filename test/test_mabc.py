@@ -10,6 +10,20 @@ def test_data():
     mabc.validate()
 
 
+@pytest.mark.parametrize(
+    ("i", "raw", "standard", "percentile"),
+    [
+        ("bl", 9, 2, 0.4),
+        ("bl", 10, 2, 0.4),
+        ("bf", 33, 19, 99.9),
+        ("bf", 40, 19, 99.9),
+    ],
+)
+def test_t_rows(i: str, raw: int, standard: int, percentile: float):
+    row = mabc._get_t_row(mabc._load()[1], i, raw)
+    assert (row.standard, row.percentile) == (standard, percentile)
+
+
 @pytest.mark.parametrize(
     ("age", "raw", "comp_res", "agg_res", "exp_rep"),
     [
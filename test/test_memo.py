@@ -0,0 +1,70 @@
+import datetime
+
+from src import memo
+from src.report import spm
+from src.time import Delta
+
+
+def test_lru():
+    calls: list[int] = []
+
+    @memo.lru(maxsize=2)
+    def f(age: Delta, raw: dict[str, int], hand: str = "Right") -> int:
+        calls.append(1)
+        return age.years + sum(raw.values())
+
+    assert f(Delta(5), {"a": 1, "b": 2}) == 8
+    assert f(Delta(5), {"b": 2, "a": 1}, hand="Right") == 8
+    assert f.stats() == memo.Stats(hits=1, misses=1, size=1, maxsize=2)
+
+    f(Delta(6), {"a": 1})
+    f(Delta(7), {"a": 1})
+    f(Delta(5), {"a": 1, "b": 2})
+    assert len(calls) == 4
+    assert f.stats().size == 2
+
+    f.clear()
+    assert f.stats() == memo.Stats(hits=0, misses=0, size=0, maxsize=2)
+
+
+def test_unhashable():
+    @memo.lru()
+    def f(x: object) -> int:
+        return 1
+
+    assert f(bytearray()) == 1
+    assert f.stats().size == 0
+
+
+def test_container_types_distinct():
+    @memo.lru()
+    def f(x: object) -> str:
+        return type(x).__name__
+
+    assert [f([1]), f((1,)), f({1}), f(frozenset([1]))] == [
+        "list",
+        "tuple",
+        "set",
+        "frozenset",
+    ]
+    assert f([1]) == "list"
+    assert f.stats().hits == 1
+
+
+def test_mixed_dict_keys():
+    @memo.lru()
+    def f(x: dict[object, int]) -> int:
+        return sum(x.values())
+
+    assert f({1: 1, "a": 2}) == 3
+    assert f.stats().size == 0
+
+
+def test_spm_raw_not_mutated():
+    raw = {k: 10 for k in spm.get_scores()}
+    spm.process.clear()
+    args = (datetime.date(2024, 1, 1), "Home", 2, spm.filers("Home")[0], "X")
+    res, rep = spm.process(*args, raw)
+    assert spm.process(*args, dict(raw)) == (res, rep)
+    assert spm.process.stats().hits == 1
+    assert "st" not in raw
@@ -0,0 +1,125 @@
+import glob
+import os
+import pathlib
+
+import pytest
+
+from src import cli, pack, table
+from src.report.dtvp import RawAge, RawSca, ScaPer
+from src.report.dtvpa import Std, Sum
+from src.report.mabc import IRow, TRow
+from src.report.spm import Spm
+
+
+@pytest.mark.parametrize(
+    ("path", "cls"),
+    [
+        ("public/dtvp-raw-ageeq.csv", RawAge),
+        ("public/dtvp-raw-sca.csv", RawSca),
+        ("public/dtvp-sca-per.csv", ScaPer),
+        ("public/dtvpa-std.csv", Std),
+        ("public/dtvpa-sum.csv", Sum),
+        ("public/mabc-i.csv", IRow),
+        ("public/mabc-t.csv", TRow),
+        ("public/spm-classroom.csv", Spm),
+        ("public/spm-home.csv", Spm),
+        ("public/spm2-home.csv", Spm),
+    ],
+)
+def test_read_csv(path: str, cls: type[table.DataclassInstance]):
+    packed = pack.read_csv(path, cls)
+    parsed = table.read_csv(path, cls)
+    assert packed.rows == parsed.rows
+    assert not hasattr(packed.rows[0], "__dict__")
+    assert [type(v) for v in packed.to_dicts()[-1].values()] == [
+        type(v) for v in parsed.to_dicts()[-1].values()
+    ]
+
+
+def test_pack_is_fresh(tmp_path: pathlib.Path):
+    out = tmp_path / "norms.bin"
+    pack.build(sorted(glob.glob("public/*.csv")), str(out))
+    assert out.read_bytes() == pathlib.Path(pack.PACK).read_bytes(), "run make pack"
+
+
+def test_stale_falls_back(tmp_path: pathlib.Path):
+    csv, out = str(tmp_path / "t.csv"), str(tmp_path / "t.bin")
+    pathlib.Path(csv).write_text(
+        "id,raw_min,raw_max,standard,percentile,rank\nhg,0,inf,1,0.1,0\n"
+    )
+    pack.build([csv], out)
+    assert pack.read_csv(csv, TRow, out).rows[0].percentile == 0.1
+
+    pathlib.Path(csv).write_text(
+        "id,raw_min,raw_max,standard,percentile,rank\nhg,0,inf,1,0.2,0\n"
+    )
+    assert pack.read_csv(csv, TRow, out).rows[0].percentile == 0.2
+
+    pathlib.Path(csv).unlink()
+    assert pack.read_csv(csv, TRow, out).rows[0].percentile == 0.1
+
+
+def test_stale_skips_hash_when_unchanged(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+):
+    csv, out = tmp_path / "s.csv", tmp_path / "s.bin"
+    csv.write_text("id,raw_min,raw_max,standard,percentile,rank\nhg,0,inf,1,0.1,0\n")
+    os.utime(csv, ns=(0, 0))
+    pack.build([str(csv)], str(out))
+    p = pack.open_pack(str(out))
+    assert p is not None
+
+    def digest(_: bytes) -> str:
+        raise AssertionError("hashed")
+
+    monkeypatch.setattr(pack, "_digest", digest)
+    assert not p.stale(str(csv))
+
+    os.utime(csv, ns=(p.built, p.built))
+    with pytest.raises(AssertionError, match="hashed"):
+        p.stale(str(csv))
+
+
+def test_key():
+    assert pack.key("./public/x.csv") == "public/x.csv"
+    assert pack.key(os.path.join(pack.ROOT, "public", "x.csv")) == "public/x.csv"
+    assert pack.key("/elsewhere/x.csv") == "/elsewhere/x.csv"
+
+
+def test_resolve_packaged(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(pack, "ROOT", str(tmp_path))
+    monkeypatch.setattr(pack, "PKG", str(tmp_path / "src"))
+    assert pack.resolve(pack.PACK) == str(tmp_path / pack.PACK)
+    (tmp_path / "src" / "public").mkdir(parents=True)
+    (tmp_path / "src" / pack.PACK).write_bytes(b"")
+    assert pack.resolve(pack.PACK) == str(tmp_path / "src" / pack.PACK)
+
+
+def test_cli_pack_outside_root(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.chdir(tmp_path)
+    assert cli.main(["pack", "-o", "n.bin"]) == 0
+    assert (tmp_path / "n.bin").read_bytes() == pathlib.Path(
+        pack.resolve(pack.PACK)
+    ).read_bytes()
+
+
+def test_read_csv_outside_root(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path):
+    monkeypatch.chdir(tmp_path)
+    parsed = table.read_csv(pack.resolve("public/mabc-t.csv"), TRow)
+    assert pack.read_csv("public/mabc-t.csv", TRow).rows == parsed.rows
+
+
+def test_read_csv_mapped():
+    mapped = pack.read_csv("public/spm-home.csv", Spm, mapped=True)
+    parsed = table.read_csv("public/spm-home.csv", Spm)
+
+    assert isinstance(mapped.rows, table.Columns)
+    assert mapped.rows == parsed.rows
+    assert mapped.to_dicts() == parsed.to_dicts()
+    query = {
+        "type": "home1",
+        "id": "vis",
+        "raw_min": table.le(20),
+        "raw_max": table.ge(20),
+    }
+    assert mapped.filter(**query).rows == parsed.filter(**query).rows
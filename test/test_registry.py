@@ -0,0 +1,55 @@
+import concurrent.futures
+import datetime
+import subprocess
+import sys
+
+from src import registry
+from src.report import mabc
+from src.time import Delta
+
+
+def test_load_once():
+    calls: list[int] = []
+
+    @registry.cached
+    def load() -> list[int]:
+        calls.append(1)
+        return [1, 2]
+
+    with concurrent.futures.ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda _: load(), range(32)))
+    assert all(r is results[0] for r in results)
+    assert len(calls) == 1
+
+    load.invalidate()
+    assert load() is not results[0]
+    assert len(calls) == 2
+
+
+def test_invalidate_clears_memo():
+    before = mabc._load()
+    assert mabc._load() is before
+    age = Delta(7)
+    raw: dict[str, int | None] = {
+        k: 5 for exes in mabc.get_comps(age).values() for k in exes
+    }
+    mabc.process(age, raw, datetime.date(2024, 1, 1))
+    assert mabc.process.stats().size > 0
+    registry.invalidate()
+    assert mabc.process.stats().size == 0
+    assert mabc._load() is not before
+
+
+def test_use():
+    prev = registry.use(registry.Registry())
+    try:
+        assert registry.current().loaded() == []
+        mabc._load()
+        assert registry.current().loaded() == ["src.report.mabc._load"]
+    finally:
+        registry.use(prev)
+
+
+def test_no_streamlit():
+    code = "import sys, src.batch; assert 'streamlit' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
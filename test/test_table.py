@@ -1,7 +1,27 @@
 import dataclasses
+import itertools
+import pathlib
+import pickle
+
+import pytest
 
 from src.report.mabc import TRow
-from src.table import Table, from_list, read_csv
+from src.table import (
+    AmbiguityError,
+    Columns,
+    DomainError,
+    Table,
+    _plan,
+    _shape,
+    dense,
+    from_list,
+    ge,
+    gt,
+    iter_csv,
+    le,
+    lt,
+    read_csv,
+)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -81,6 +101,28 @@ def test_to_dicts():
     ]
 
 
+def test_derived():
+    t = init_bands()
+    calls: list[int] = []
+
+    def build(t: Table[Band]) -> int:
+        calls.append(1)
+        return len(t.rows)
+
+    assert t.derived("n", build) == t.derived("n", build) == len(t.rows)
+    assert calls == [1]
+    assert init_bands().derived("n", build) == len(t.rows) and calls == [1, 1]
+
+
+def test_to_columns():
+    t = init_table(("a", 1), ("b", 2))
+    cols = t.to_columns()
+    assert cols == {"name": ["a", "b"], "value": [1, 2]}
+    assert t.to_columns() is cols
+    assert from_list([]).to_columns() == {}
+    assert from_list([]).to_dicts() == []
+
+
 def test_from_list():
     rows = [Row("x", 10)]
     t = from_list(rows)
@@ -90,3 +132,244 @@ def test_from_list():
 def test_read_csv():
     t = read_csv("public/mabc-t.csv", TRow)
     assert len(t.rows) == 75
+
+
+def test_iter_csv():
+    assert (
+        list(iter_csv("public/mabc-t.csv", TRow))
+        == read_csv("public/mabc-t.csv", TRow).rows
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class Opt:
+    name: str
+    value: int = 7
+
+
+def test_read_csv_schema(tmp_path: pathlib.Path):
+    path = tmp_path / "t.csv"
+    path.write_text("value,name\n1,a\n\n2,b\n")
+    assert read_csv(str(path), Row).rows == [Row("a", 1), Row("b", 2)]
+    assert read_csv(str(path), Opt).rows == [Opt("a", 1), Opt("b", 2)]
+
+    path.write_text("name\na\n")
+    assert read_csv(str(path), Opt).rows == [Opt("a")]
+    assert list(iter_csv(str(path), Opt)) == [Opt("a")]
+
+
+def test_read_csv_slots():
+    t = read_csv("public/mabc-t.csv", TRow)
+    row = t.rows[0]
+    assert not hasattr(row, "__dict__")
+    assert pickle.loads(pickle.dumps(t)) == t
+    assert dataclasses.replace(row, rank=1).rank == 1
+    assert t.to_dicts()[0] == dataclasses.asdict(row)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Checked:
+    name: str
+    value: int
+
+    def __post_init__(self):
+        if self.value < 0:
+            raise ValueError(f"negative value for {self.name}")
+
+
+def test_read_csv_runs_init(tmp_path: pathlib.Path):
+    path = tmp_path / "t.csv"
+    path.write_text("name,value\na,1\nb,-1\n")
+    with pytest.raises(ValueError, match="negative value for b"):
+        read_csv(str(path), Checked)
+
+
+@dataclasses.dataclass(frozen=True)
+class Band:
+    id: str
+    age_min: int
+    age_max: float
+    raw_min: int
+    raw_max: float
+
+
+def init_bands() -> Table[Band]:
+    rows: list[Band] = []
+    for i in ["a", "b"]:
+        for age in range(0, 10, 2):
+            for raw in range(0, 20, 5):
+                rows.append(Band(i, age, age + 2, raw, raw + 4))
+            rows.append(Band(i, age, age + 2, 20, float("inf")))
+    return from_list(rows)
+
+
+def test_bounds():
+    assert lt(2)(1) and not lt(2)(2)
+    assert le(2)(2) and not le(2)(3)
+    assert gt(2)(3) and not gt(2)(2)
+    assert ge(2)(2) and not ge(2)(1)
+
+
+def test_filter_index_matches_scan():
+    t = init_bands()
+    for i, age, raw in itertools.product(["a", "b", "c"], range(-1, 12), range(-1, 30)):
+        indexed = t.filter(
+            id=i,
+            age_min=le(age),
+            age_max=gt(age),
+            raw_min=le(raw),
+            raw_max=ge(raw),
+        )
+        scanned = [
+            r
+            for r in t.rows
+            if r.id == i
+            and r.age_min <= age < r.age_max
+            and r.raw_min <= raw <= r.raw_max
+        ]
+        assert indexed.rows == scanned
+
+
+def test_filter_index_overlapping():
+    t = from_list([Band("a", 0, 10, 0, 5)] * 20 + [Band("a", 0, 10, 3, 8)] * 20)
+    res = t.filter(id="a", raw_min=le(4), raw_max=ge(4))
+    assert len(res.rows) == 40
+    res = t.filter(id="a", raw_min=le(7), raw_max=ge(7))
+    assert res.rows == [Band("a", 0, 10, 3, 8)] * 20
+
+
+def test_filter_index_residual():
+    t = init_bands()
+    res = t.filter(id="a", raw_min=le(6), raw_max=ge(6), age_min=lambda v: v > 5)
+    assert [r.age_min for r in res.rows] == [6, 8]
+
+
+def test_filter_plan():
+    seen: list[str] = []
+
+    def pred(v: str) -> bool:
+        seen.append(v)
+        return True
+
+    t = init_table(("a", 1), ("b", 2), ("a", 3))
+    res = t.filter(name=pred, value=ge(2))
+    assert [r.value for r in res.rows] == [2, 3]
+    assert seen == ["b", "a"]
+
+    res = t.filter(name=pred, value=3)
+    assert [r.value for r in res.rows] == [3]
+    assert seen[2:] == ["a"]
+
+    shape = _shape([("id", "a"), ("raw_min", le(1)), ("raw_max", ge(1))])
+    assert _plan(shape) is _plan(shape)
+    assert _plan(shape).eq_names == ("id",)
+    assert [a.lo for a in _plan(shape).index_axes] == ["raw_min"]
+    assert _plan(_shape([("raw_min", le(1)), ("raw_max", ge(2))])).axes == ()
+
+
+def test_dense():
+    t = init_bands()
+    d = dense(
+        t, key=lambda r: r.id, age=lambda r: (r.age_min, r.age_max), age_closed=False
+    )
+    assert d.get("a", 7, 3) == Band("a", 2, 4, 5, 9)
+    assert d.get("b", 0, 9) == Band("b", 8, 10, 0, 4)
+    assert d.get("a", 1000, 0) == Band("a", 0, 2, 20, float("inf"))
+
+
+def test_dense_domain():
+    t = init_bands()
+    d = dense(
+        t, key=lambda r: r.id, age=lambda r: (r.age_min, r.age_max), age_closed=False
+    )
+    for key, raw, age in [("c", 0, 0), ("a", -1, 0), ("a", 0, -1), ("a", 0, 10)]:
+        with pytest.raises(DomainError):
+            d.get(key, raw, age)
+
+
+def test_dense_domain_message():
+    t = init_bands()
+    d = dense(
+        t, key=lambda r: r.id, age=lambda r: (r.age_min, r.age_max), age_closed=False
+    )
+    with pytest.raises(DomainError, match="^no row for 'a' at age 0 and raw -1$"):
+        d.get("a", -1, 0)
+    d = dense(t, key=lambda r: r.id, raw=("age_min", "age_min"))
+    with pytest.raises(DomainError, match="^no row for 'c' at age 3$"):
+        d.get("c", 3)
+
+
+def test_dense_first_match():
+    t = from_list([Band("a", 0, 10, 0, 5), Band("a", 0, 10, 3, 8)])
+    d = dense(t, key=lambda r: r.id)
+    assert d.get("a", 4) == Band("a", 0, 10, 0, 5)
+    assert d.get("a", 7) == Band("a", 0, 10, 3, 8)
+    with pytest.raises(DomainError):
+        d.get("a", 9)
+
+
+def test_dense_unique():
+    t = from_list([Band("a", 0, 10, 0, 5), Band("a", 0, 10, 3, 8)])
+    with pytest.raises(AmbiguityError, match="raw 3"):
+        dense(t, key=lambda r: r.id, unique=True)
+
+    t = from_list([Band("a", 0, 5, 0, 5), Band("a", 4, 10, 0, 5)])
+    with pytest.raises(AmbiguityError, match="age 4"):
+        dense(t, key=lambda r: r.id, age=lambda r: (r.age_min, r.age_max), unique=True)
+    t = from_list([Band("a", 0, 4, 0, 5), Band("a", 4, 10, 0, 5)])
+    d = dense(
+        t,
+        key=lambda r: r.id,
+        age=lambda r: (r.age_min, r.age_max),
+        age_closed=False,
+        unique=True,
+    )
+    assert d.get("a", 1, 4) == Band("a", 4, 10, 0, 5)
+
+
+def init_columns() -> Table[Band]:
+    t = init_bands()
+    names = ["id", "age_min", "age_max", "raw_min", "raw_max"]
+    return Table(Columns(Band, {n: [getattr(r, n) for r in t.rows] for n in names}))
+
+
+def test_columns():
+    t, c = init_bands(), init_columns()
+    assert c.rows == t.rows
+    assert c.item() == t.item()
+    assert c.to_dicts() == t.to_dicts()
+    assert c.rows[2:4] == t.rows[2:4]
+
+
+def test_columns_filter():
+    t, c = init_bands(), init_columns()
+    for i, age, raw in itertools.product(["a", "b"], range(0, 10, 3), range(0, 25, 4)):
+        kwargs = {
+            "id": i,
+            "age_min": le(age),
+            "age_max": gt(age),
+            "raw_min": le(raw),
+            "raw_max": ge(raw),
+        }
+        res = c.filter(**kwargs)
+        assert isinstance(res.rows, Columns)
+        assert res.rows == t.filter(**kwargs).rows
+    assert (
+        c.filter(raw_min=lambda v: v > 10).rows
+        == t.filter(raw_min=lambda v: v > 10).rows
+    )
+    assert c.filter(id="a").filter(raw_min=5).rows == t.filter(id="a", raw_min=5).rows
+
+
+def test_columns_map_sort_concat():
+    t, c = init_bands(), init_columns()
+    assert (
+        c.map(lambda r: Row(r.id, r.raw_min)).rows
+        == t.map(lambda r: Row(r.id, r.raw_min)).rows
+    )
+    assert (
+        c.sort(key=lambda r: -r.raw_min).rows == t.sort(key=lambda r: -r.raw_min).rows
+    )
+    assert c.concat(c).rows == t.concat(t).rows
+    assert c.concat(init_columns()).rows == t.concat(t).rows
+    assert c.concat(t).rows == t.concat(t).rows
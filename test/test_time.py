@@ -2,7 +2,7 @@ import datetime
 
 import pytest
 
-from src.time import Delta, minus_delta, to_delta
+from src.time import Delta, minus_delta, parse_date, to_delta
 
 
 @pytest.mark.parametrize(
@@ -81,3 +81,15 @@ def test_to_delta(start: datetime.date, end: datetime.date, expected: Delta):
 )
 def test_minus_delta(date: datetime.date, delta: Delta, expected: datetime.date):
     assert minus_delta(date, delta) == expected
+
+
+@pytest.mark.parametrize(
+    "s,expected",
+    [
+        ("03.03.2026", datetime.date(year=2026, month=3, day=3)),
+        ("2026-03-03", datetime.date(year=2026, month=3, day=3)),
+        (" 29.02.2024 ", datetime.date(year=2024, month=2, day=29)),
+    ],
+)
+def test_parse_date(s: str, expected: datetime.date):
+    assert parse_date(s) == expected
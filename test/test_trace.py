@@ -0,0 +1,63 @@
+import datetime
+import threading
+
+from src import registry, table, trace
+from src.report import mabc
+from src.time import Delta
+
+
+def _run():
+    age = Delta(years=8)
+    raw: dict[str, int | None] = {
+        k: 5 for exes in mabc.get_comps(age).values() for k in exes
+    }
+    return mabc.process(age, raw, datetime.date(2026, 3, 3))
+
+
+def test_disabled():
+    filter = table.Table.filter
+    with trace.session() as t:
+        _run()
+    assert t.spans == [] and t.counters == {}
+    assert table.Table.filter is filter
+
+
+def test_session():
+    registry.invalidate()
+    trace.enable()
+    try:
+        _run()
+        with trace.session() as t:
+            registry.invalidate()
+            _run()
+    finally:
+        trace.disable()
+    assert not trace.enabled()
+
+    out = t.to_dict()
+    spans = [(s["name"], s["depth"]) for s in out["spans"]]
+    assert spans[0] == ("mabc.process", 0)
+    assert {("mabc._load", 1), ("mabc._process_comp", 1), ("mabc.report", 1)} <= set(
+        spans
+    )
+    assert out["counters"]["mabc._get_t_row"]["calls"] == 4
+    assert out["counters"]["Table.filter"]["calls"] > 0
+
+
+def test_enable_concurrent():
+    barrier = threading.Barrier(8)
+
+    def run():
+        barrier.wait()
+        trace.enable()
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert not hasattr(getattr(table.Table.filter, "__wrapped__"), "__wrapped__")
+    finally:
+        trace.disable()
+    assert not hasattr(table.Table.filter, "__wrapped__")
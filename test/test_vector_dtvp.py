@@ -0,0 +1,75 @@
+import datetime
+import random
+
+import numpy as np
+
+from src import table
+from src.report import dtvp, dtvpa
+from src.time import Delta
+from src.vector import dtvp as vdtvp
+from src.vector import dtvpa as vdtvpa
+
+
+def _cohort(
+    n: int, years: tuple[int, int], raws: int, tests: list[str]
+) -> tuple[list[int], list[list[int]]]:
+    rnd = random.Random(0)
+    months = [rnd.randint(years[0] * 12, years[1] * 12 + 11) for _ in range(n)]
+    raw = [[rnd.randint(0, raws) for _ in tests] for _ in range(n)]
+    return months, raw
+
+
+def test_dtvp_matches_scalar():
+    tests = list(dtvp.get_tests())
+    months, raw = _cohort(300, (4, 12), 193, tests)
+    scalar = []
+    for m, r in zip(months, raw):
+        try:
+            res = dtvp.process(
+                Delta(m // 12, m % 12), dict(zip(tests, r)), datetime.date.today()
+            )
+        except table.DomainError:
+            continue
+        scalar.append((m, r, res))
+
+    sub, comp = vdtvp.process(
+        np.array([s[0] for s in scalar]), np.array([s[1] for s in scalar])
+    )
+
+    for i, (_, _, (s, c, _)) in enumerate(scalar):
+        for j, row in enumerate(s.rows):
+            age_eq = f"{sub.age_eq_y[i, j]};{sub.age_eq_m[i, j]}"
+            assert dtvp.to_age(age_eq) == row.age_eq
+            assert sub.scaled[i, j] == row.scaled
+            assert sub.percentile[i, j] == row.percentile
+            assert sub.descriptive[i, j] == row.descriptive
+            assert sub.level[i, j] == row.level
+        for j, row in enumerate(c.rows):
+            assert comp.sum_scaled[i, j] == row.sum_scaled
+            assert comp.index[i, j] == row.index
+            assert comp.percentile[i, j] == row.percentile
+            assert comp.descriptive[i, j] == row.descriptive
+            assert comp.level[i, j] == row.level
+
+
+def test_dtvpa_matches_scalar():
+    tests = list(dtvpa.get_tests())
+    months, raw = _cohort(300, (11, 17), 108, tests)
+
+    sub, comp = vdtvpa.process(np.array(months), np.array(raw))
+
+    for i, (m, r) in enumerate(zip(months, raw)):
+        s, c, _ = dtvpa.process(
+            Delta(m // 12, m % 12), dict(zip(tests, r)), datetime.date.today()
+        )
+        for j, row in enumerate(s.rows):
+            assert sub.standard[i, j] == row.standard
+            assert sub.percentile[i, j] == row.percentile
+            assert sub.description[i, j] == row.description
+            assert sub.level[i, j] == row.level
+        for j, row in enumerate(c.rows):
+            assert comp.sum_standard[i, j] == row.sum_standard
+            assert comp.index[i, j] == row.index
+            assert comp.percentile[i, j] == row.percentile
+            assert comp.description[i, j] == row.description
+            assert comp.level[i, j] == row.level
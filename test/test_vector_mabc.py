@@ -0,0 +1,44 @@
+import datetime
+import random
+
+import numpy as np
+
+from src.report import mabc
+from src.time import Delta
+from src.vector import mabc as vmabc
+
+EXES = sorted(
+    {e for a in [5, 7, 11] for c in mabc.get_comps(Delta(a)).values() for e in c}
+)
+
+
+def test_process_matches_scalar():
+    rnd = random.Random(0)
+    ages = [rnd.randint(5, 15) for _ in range(300)]
+    raws: list[dict[str, int | None]] = []
+    for a in ages:
+        raw: dict[str, int | None] = {}
+        for exes in mabc.get_comps(Delta(a)).values():
+            for e in exes:
+                raw[e] = rnd.randint(0, 121)
+        for e in rnd.sample(mabc.get_failed(), rnd.randint(0, 2)):
+            raw[e] = None
+        raws.append(raw)
+
+    res = vmabc.process(
+        np.array(ages),
+        {
+            e: np.array([np.nan if r.get(e) is None else r[e] for r in raws])
+            for e in EXES
+        },
+    )
+
+    for i, (a, raw) in enumerate(zip(ages, raws)):
+        comp, agg, _ = mabc.process(Delta(a), raw, datetime.date.today())
+        for r in comp.rows:
+            assert res.comp[r.id][i] == r.standard
+        for r in agg.rows:
+            assert res.raw[r.id][i] == r.raw
+            assert res.standard[r.id][i] == r.standard
+            assert res.percentile[r.id][i] == r.percentile
+            assert vmabc.level(res.standard[r.id])[i] == r.level
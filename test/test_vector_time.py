@@ -0,0 +1,92 @@
+import datetime
+import random
+
+import numpy as np
+import pytest
+
+from src import time
+from src.vector import time as vtime
+
+
+def _dates(n: int, seed: int) -> list[datetime.date]:
+    rnd = random.Random(seed)
+    start = datetime.date(2000, 1, 1).toordinal()
+    days = [start + rnd.randint(0, 30 * 365) for _ in range(n)]
+    # month ends and leap days exercise the borrow rules
+    days += [
+        datetime.date(y, m, 1).toordinal() - 1
+        for y in (2023, 2024)
+        for m in range(1, 13)
+    ]
+    return [datetime.date.fromordinal(d) for d in days]
+
+
+def test_to_delta_matches_scalar():
+    starts = _dates(2000, 0)
+    ends = _dates(2000, 1)
+    pairs = [(s, e) if s <= e else (e, s) for s, e in zip(starts, ends)]
+    got = vtime.to_delta(
+        np.array([s for s, _ in pairs], dtype="datetime64[D]"),
+        np.array([e for _, e in pairs], dtype="datetime64[D]"),
+    )
+    want = [time.to_delta(s, e) for s, e in pairs]
+    assert got.years.tolist() == [d.years for d in want]
+    assert got.months.tolist() == [d.months for d in want]
+    assert got.days.tolist() == [d.days for d in want]
+    assert got.total_months.tolist() == [d.years * 12 + d.months for d in want]
+
+
+def test_minus_delta_matches_scalar():
+    rnd = random.Random(2)
+    starts = _dates(2000, 3)
+    deltas = [
+        time.Delta(rnd.randint(-2, 15), rnd.randint(0, 11), rnd.randint(0, 40))
+        for _ in starts
+    ]
+    got = vtime.minus_delta(
+        np.array(starts, dtype="datetime64[D]"),
+        vtime.Deltas(
+            np.array([d.years for d in deltas]),
+            np.array([d.months for d in deltas]),
+            np.array([d.days for d in deltas]),
+        ),
+    )
+    want = [time.minus_delta(s, d) for s, d in zip(starts, deltas)]
+    assert got.tolist() == want
+
+
+def test_parse_dates():
+    values = ["01.02.2020", " 29.02.2024", "2021-12-31", "5.3.2019"]
+    assert vtime.parse_dates(values).tolist() == [time.parse_date(v) for v in values]
+
+
+def test_parse_dates_iso_only():
+    values = ["2020-01-01", "2024-02-29"]
+    assert vtime.parse_dates(values).tolist() == [time.parse_date(v) for v in values]
+
+
+def test_parse_dates_empty():
+    out = vtime.parse_dates([])
+    assert out.shape == (0,) and out.dtype == np.dtype("datetime64[D]")
+
+
+@pytest.mark.parametrize("value", ["30.02.2021", "01.13.2020", "1.2", "x", ""])
+def test_parse_dates_invalid(value: str):
+    with pytest.raises(ValueError):
+        vtime.parse_dates(["01.01.2020", value])
+
+
+@pytest.mark.parametrize(
+    ("values", "message"),
+    [
+        (["xx"], vtime.FORMAT),
+        (["xx", "yy"], vtime.FORMAT),
+        (["1.x.2020"], vtime.FORMAT),
+        (["31.04.2020"], "invalid date '31.04.2020'"),
+        ([" "], "invalid date ''"),
+    ],
+)
+def test_parse_dates_garbage(values: list[str], message: str):
+    with pytest.raises(ValueError) as e:
+        vtime.parse_dates(values)
+    assert str(e.value) == message